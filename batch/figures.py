@@ -0,0 +1,136 @@
+"""
+Figuras estáticas para los trabajos por lotes (backend Agg: sin pantalla).
+Cada renderizador recibe el resultado del método y dibuja sobre un eje de Matplotlib;
+los datos grandes se reducen antes con render_prep (LTTB / imagen de densidad).
+"""
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+
+from src.simulation.precision import Quantized  # noqa: E402
+from src.visualization.plot_styles import set_academic_style, add_watermark  # noqa: E402
+from src.visualization.render_prep import decimate_line, rasterize, pool_counts, shade  # noqa: E402
+
+
+def _series(ax, result, job):
+    ax.plot(result, '-', linewidth=1.2, label=f"r = {job.init.get('r')}")
+    ax.set_xlabel("Tiempo (Generaciones)")
+    ax.set_ylabel("Población Relativa")
+    ax.legend(loc='upper right')
+
+
+def _batch_series(ax, result, job):
+    trajectories = np.atleast_2d(result[0] if isinstance(result, tuple) else result)
+    for trajectory in trajectories[:20]:
+        ax.plot(trajectory, '-', linewidth=1.0, alpha=0.8)
+    ax.set_xlabel("Tiempo (Generaciones)")
+    ax.set_ylabel("x")
+
+
+def _density_image(ax, counts, bounds, cmap):
+    ax.imshow(shade(pool_counts(counts)), origin='lower', aspect='auto', cmap=cmap,
+              extent=[bounds[0], bounds[1], bounds[2], bounds[3]], interpolation='nearest')
+
+
+def _bifurcation_points(ax, result, job):
+    r_values, x_values = result[0], result[1]
+    counts, bounds = rasterize(r_values, x_values, bounds=(r_values.min(), r_values.max(), 0.0, 1.0))
+    _density_image(ax, counts, bounds, 'Greys')
+    ax.set_xlabel("r")
+    ax.set_ylabel("x")
+
+
+def _bifurcation_density(ax, result, job):
+    r_values, x_edges, counts = result[0], result[1], result[2]
+    _density_image(ax, counts.T, (r_values[0], r_values[-1], x_edges[0], x_edges[-1]), 'Greys')
+    ax.set_xlabel("r")
+    ax.set_ylabel("x")
+
+
+def _lyapunov(ax, result, job):
+    r_values = np.atleast_1d(job.params.get("r_values"))
+    exponents = np.atleast_1d(result)
+    ax.plot(r_values if len(r_values) == len(exponents) else np.arange(len(exponents)), exponents, '-', linewidth=1.0)
+    ax.axhline(0.0, color='#E63946', linestyle=':', alpha=0.6)
+    ax.set_xlabel("r")
+    ax.set_ylabel("λ")
+
+
+def _lorenz_trajectory(ax, result, job):
+    trajectory = np.asarray(result)
+    if trajectory.ndim == 3:
+        trajectory = trajectory[0]
+    line, _ = decimate_line(trajectory)
+    ax.plot(line[:, 0], line[:, 2], '-', linewidth=0.6)
+    ax.set_xlabel("x")
+    ax.set_ylabel("z")
+
+
+def _chaos_points(ax, result, job):
+    counts, bounds = rasterize(result[:, 0], result[:, 1])
+    _density_image(ax, counts, bounds, 'BuGn')
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+
+def _chaos_density(ax, result, job):
+    counts, bounds = result[0], result[1]
+    _density_image(ax, counts, bounds, 'BuGn')
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+
+def _dimensions(ax, result, job):
+    ax.loglog(result["epsilon"], result["box_counts"], 'o-', label=f"Cajas: D ≈ {result['box_dimension']:.3f}")
+    ax.loglog(result["radii"], result["correlation"] * result["box_counts"][-1], 's-',
+              label=f"Correlación: D ≈ {result['correlation_dimension']:.3f}")
+    ax.set_xlabel("ε / r")
+    ax.legend(loc='lower right')
+
+
+# (sistema, método) -> renderizador
+RENDERERS = {
+    ("logistic", "simulate"): _series,
+    ("logistic", "simulate_batch"): _batch_series,
+    ("logistic", "generate_bifurcation_data"): _bifurcation_points,
+    ("logistic", "generate_bifurcation_density"): _bifurcation_density,
+    ("logistic", "lyapunov_exponents"): _lyapunov,
+    ("lorenz", "simulate"): _lorenz_trajectory,
+    ("lorenz", "simulate_ensemble"): _lorenz_trajectory,
+    ("chaos_game", "generate_points"): _chaos_points,
+    ("chaos_game", "accumulate_density"): _chaos_density,
+    ("lorenz", "fractal_dimensions"): _dimensions,
+    ("chaos_game", "fractal_dimensions"): _dimensions,
+}
+
+
+def render_figure(job, result, path: str) -> bool:
+    """
+    Dibuja el resultado del trabajo y lo guarda como PNG.
+
+    Returns:
+        bool: False si no hay renderizador para (sistema, método).
+    """
+    renderer = RENDERERS.get((job.system, job.method))
+    if renderer is None:
+        return False
+    # Los renderizadores trabajan con valores: las salidas uint16 se decodifican aquí
+    if isinstance(result, tuple):
+        result = tuple(np.asarray(value) if isinstance(value, Quantized) else value for value in result)
+    elif isinstance(result, Quantized):
+        result = np.asarray(result)
+
+    set_academic_style()
+    fig, ax = plt.subplots(figsize=(10, 6))
+    try:
+        renderer(ax, result, job)
+        ax.set_title(job.job_id)
+        add_watermark(ax)
+        fig.tight_layout()
+        fig.savefig(path, dpi=120)
+    finally:
+        plt.close(fig)
+    return True
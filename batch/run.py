@@ -0,0 +1,260 @@
+"""
+Ejecutor de trabajos por lotes sin interfaz (cron, servidores sin pantalla).
+
+Uso (desde la raíz del repositorio):
+    python -m batch.run batch/examples/nightly.toml
+    python -m batch.run jobs.json --workers 4          # sobrescribe n_workers
+    python -m batch.run jobs.json --force              # recalcula aunque existan las salidas
+    python -m batch.run jobs.json --dry-run            # solo lista los trabajos
+
+Cada trabajo corre en un proceso del pool con sus límites de tiempo y memoria; escribe
+sus arrays (y su figura PNG, con el backend Agg) en output_dir. Los trabajos cuyas salidas
+ya existen se omiten. Salvo cache = false, los cálculos pasan por la ResultCache en disco
+(la misma del dashboard), así que un resultado ya calculado por cualquiera se reutiliza.
+Al final se escribe manifest.json con los tiempos por trabajo.
+Sale con código 1 si algún trabajo falló o excedió su límite.
+"""
+import argparse
+import inspect
+import json
+import math
+import os
+import platform
+import shutil
+import signal
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+import numpy as np
+
+from batch.specs import JobSpec, load_spec, expand_jobs
+
+
+class JobTimeout(Exception):
+    """El trabajo superó su timeout_s."""
+
+
+def _on_alarm(signum, frame):
+    raise JobTimeout()
+
+
+@contextmanager
+def _resource_limits(timeout_s: float = None, max_memory_mb: float = None):
+    """
+    Límites del trabajo dentro del proceso trabajador: memoria virtual (RLIMIT_AS, solo el
+    límite blando, que se restaura al terminar) y tiempo (SIGALRM). El timeout se comprueba
+    entre instrucciones de Python: una operación de NumPy en curso termina antes de cortar.
+    """
+    previous_limit = None
+    if max_memory_mb:
+        import resource
+        previous_limit = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (int(max_memory_mb * 2**20), previous_limit[1]))
+    if timeout_s:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.alarm(max(1, math.ceil(timeout_s)))
+    try:
+        yield
+    finally:
+        if timeout_s:
+            signal.alarm(0)
+        if previous_limit is not None:
+            import resource
+            resource.setrlimit(resource.RLIMIT_AS, previous_limit)
+
+
+def _as_arrays(result) -> dict:
+    """
+    Resultado del método -> arrays con nombre (tuplas como arr_i, como en la caché).
+    Un resultado Quantized se guarda como sus enteros uint16 más <nombre>_offset y <nombre>_scale.
+    """
+    from src.simulation.precision import Quantized
+
+    if isinstance(result, dict):
+        named = {str(key): value for key, value in result.items()}
+    elif isinstance(result, tuple):
+        named = {f"arr_{i}": value for i, value in enumerate(result)}
+    else:
+        named = {"result": result}
+
+    arrays = {}
+    for key, value in named.items():
+        if isinstance(value, Quantized):
+            arrays.update({key: value.data, f"{key}_offset": value.offset, f"{key}_scale": value.scale})
+        else:
+            arrays[key] = np.asarray(value)
+    return arrays
+
+
+def _save_arrays(arrays: dict, path: str, fmt: str) -> None:
+    """Escritura atómica (temporal + rename): un trabajo interrumpido nunca deja una salida que luego se omita."""
+    directory = os.path.dirname(path)
+    if fmt == "npy":
+        tmp = tempfile.mkdtemp(prefix=".tmp-", dir=directory)
+        for key, value in arrays.items():
+            np.save(os.path.join(tmp, f"{key}.npy"), value)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        os.rename(tmp, path)
+        return
+
+    fd, tmp = tempfile.mkstemp(prefix=".tmp-", suffix=".npz", dir=directory)
+    with os.fdopen(fd, "wb") as f:
+        (np.savez_compressed if fmt == "npz_compressed" else np.savez)(f, **arrays)
+    os.replace(tmp, path)
+
+
+def run_job(job: JobSpec, render: bool) -> dict:
+    """
+    Ejecuta un trabajo en el proceso actual (lo llama el pool).
+
+    Returns:
+        dict: Tiempos por etapa (compute_s, save_s, figure_s), salidas escritas y pid.
+    """
+    from src.systems.registry import get_system
+
+    timings = {"pid": os.getpid(), "started_at": time.time()}
+    job_start = start = time.perf_counter()
+    with _resource_limits(job.settings["timeout_s"], job.settings["max_memory_mb"]):
+        cls = get_system(job.system)
+        is_static = isinstance(inspect.getattr_static(cls, job.method), staticmethod)
+        target = cls if is_static else cls(**job.init)
+        if job.settings["cache"]:
+            from src.simulation.cache import ResultCache
+            result = ResultCache(job.settings["cache_dir"]).call(target, job.method, **job.params)
+        else:
+            result = getattr(target, job.method)(**job.params)
+        timings["compute_s"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _save_arrays(_as_arrays(result), job.output_path(), job.settings["format"])
+        outputs = [job.output_path()]
+        timings["save_s"] = time.perf_counter() - start
+
+        if render:
+            from batch.figures import render_figure
+
+            start = time.perf_counter()
+            fd, tmp = tempfile.mkstemp(prefix=".tmp-", suffix=".png", dir=os.path.dirname(job.figure_path()))
+            os.close(fd)
+            try:
+                render_figure(job, result, tmp)
+                os.replace(tmp, job.figure_path())
+            finally:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            outputs.append(job.figure_path())
+            timings["figure_s"] = time.perf_counter() - start
+
+    timings["run_s"] = time.perf_counter() - job_start
+    timings["outputs"] = outputs
+    return timings
+
+
+def _renders(job: JobSpec) -> bool:
+    """¿Se espera figura para este trabajo? (solo si hay renderizador para su método)."""
+    if not job.settings["figures"]:
+        return False
+    from batch.figures import RENDERERS
+    return (job.system, job.method) in RENDERERS
+
+
+def _job_record(job: JobSpec) -> dict:
+    return {"job_id": job.job_id, "system": job.system, "method": job.method,
+            "init": job.init, "params": job.params}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Trabajos por lotes de M3: Dynamical Systems")
+    parser.add_argument("spec", help="Especificación de trabajos (.json o .toml)")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos del pool (sobrescribe n_workers)")
+    parser.add_argument("--output-dir", default=None, help="Directorio de salida (sobrescribe output_dir)")
+    parser.add_argument("--manifest", default=None, help="Ruta del manifiesto (por defecto <output_dir>/manifest.json)")
+    parser.add_argument("--force", action="store_true", help="Recalcular aunque existan las salidas")
+    parser.add_argument("--dry-run", action="store_true", help="Listar los trabajos sin ejecutarlos")
+    args = parser.parse_args(argv)
+
+    spec = load_spec(args.spec)
+    if args.output_dir is not None:
+        spec.setdefault("settings", {})["output_dir"] = args.output_dir
+        for entry in spec.get("jobs", []):
+            entry.pop("output_dir", None)
+    jobs = expand_jobs(spec)
+    settings = spec.get("settings", {})
+    n_workers = args.workers or settings.get("n_workers", 1)
+    manifest_path = args.manifest or os.path.join(settings.get("output_dir", "outputs"), "manifest.json")
+
+    # Los trabajos omitidos conservan los tiempos de la ejecución que los produjo
+    previous = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            previous = {record["job_id"]: record for record in json.load(f).get("jobs", [])}
+
+    records = []
+    pending = []
+    for job in jobs:
+        render = _renders(job)
+        expected = [job.output_path()] + ([job.figure_path()] if render else [])
+        if not args.force and all(os.path.exists(path) for path in expected):
+            records.append({**previous.get(job.job_id, {}), **_job_record(job), "status": "skipped", "outputs": expected})
+        else:
+            pending.append((job, render))
+
+    if args.dry_run:
+        for job, _ in pending:
+            print(f"pendiente  {job.job_id}")
+        for record in records:
+            print(f"omitido    {record['job_id']}")
+        return 0
+
+    run_start = time.perf_counter()
+    if pending:
+        for directory in {job.settings["output_dir"] for job, _ in pending}:
+            os.makedirs(directory, exist_ok=True)
+        with ProcessPoolExecutor(max_workers=max(1, n_workers)) as pool:
+            submitted = {}
+            for job, render in pending:
+                submitted[pool.submit(run_job, job, render)] = (job, time.time())
+            for future in as_completed(submitted):
+                job, submitted_at = submitted[future]
+                # wall_time_s incluye la espera en la cola del pool (queue_s)
+                record = {**_job_record(job), "wall_time_s": time.time() - submitted_at}
+                try:
+                    record.update(status="done", **future.result())
+                    record["queue_s"] = max(0.0, record.pop("started_at") - submitted_at)
+                except JobTimeout:
+                    record.update(status="timeout", error=f"superó timeout_s={job.settings['timeout_s']}")
+                except MemoryError:
+                    record.update(status="failed", error=f"superó max_memory_mb={job.settings['max_memory_mb']}")
+                except Exception as exc:
+                    record.update(status="failed", error=f"{type(exc).__name__}: {exc}")
+                records.append(record)
+                print(f"{record['status']:<8} {job.job_id:<60} {record['wall_time_s']:8.2f} s"
+                      + (f"  ({record['error']})" if "error" in record else ""))
+
+    statuses = [record["status"] for record in records]
+    manifest = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "spec": os.path.abspath(args.spec),
+            "n_workers": n_workers,
+            "wall_time_s": time.perf_counter() - run_start,
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+        },
+        "summary": {status: statuses.count(status) for status in ("done", "skipped", "failed", "timeout")},
+        "jobs": sorted(records, key=lambda record: record["job_id"]),
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(manifest_path)), exist_ok=True)
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2, default=str)
+    print(f"{manifest['summary']} -> {manifest_path}")
+
+    return 1 if manifest["summary"]["failed"] or manifest["summary"]["timeout"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
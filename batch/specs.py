@@ -0,0 +1,151 @@
+"""
+Especificaciones de trabajos por lotes (JSON o TOML).
+
+Ejemplo (TOML):
+
+    [settings]
+    output_dir = "outputs/nightly"
+    n_workers = 2
+    format = "npz"            # npz | npz_compressed | npy
+    figures = true
+    timeout_s = 600           # límite por trabajo
+    max_memory_mb = 4096      # límite de memoria por proceso trabajador
+    output_dtype = "float32"  # float64 | float32 | uint16, para los métodos que lo admiten
+    cache = true              # reutilizar/guardar resultados en la ResultCache en disco
+                              # (los trabajos aleatorios sin seed entera nunca se cachean)
+    cache_dir = "..."         # opcional: por defecto $M3_CACHE_DIR o ~/.cache/m3_dynamics
+
+    [[jobs]]
+    name = "logistic_series"
+    system = "logistic"       # clave del registro de sistemas
+    method = "simulate"
+    params = { x0 = 0.1, steps = 200 }
+    grid = { r = [3.5, 3.7, 3.9] }   # producto cartesiano de todas las listas
+
+Los parámetros (fijos o de la malla) que coinciden con el constructor del sistema se
+usan para instanciarlo; el resto se pasa al método. Cada trabajo puede sobrescribir
+cualquier clave de [settings].
+"""
+import inspect
+import itertools
+import json
+import os
+import re
+from dataclasses import dataclass, field
+
+DEFAULT_SETTINGS = {
+    "output_dir": "outputs",
+    "n_workers": 1,
+    "format": "npz",
+    "figures": True,
+    "timeout_s": None,
+    "max_memory_mb": None,
+    "output_dtype": None,
+    "cache": True,
+    "cache_dir": None,
+}
+FORMATS = ("npz", "npz_compressed", "npy")
+
+
+@dataclass
+class JobSpec:
+    """Un trabajo concreto (un punto de la malla de parámetros)."""
+    job_id: str
+    system: str
+    method: str
+    init: dict
+    params: dict
+    settings: dict = field(default_factory=dict)
+
+    def output_path(self) -> str:
+        """Ruta de los arrays: <job_id>.npz o el directorio <job_id>/ para 'npy'."""
+        suffix = "" if self.settings["format"] == "npy" else ".npz"
+        return os.path.join(self.settings["output_dir"], self.job_id + suffix)
+
+    def figure_path(self) -> str:
+        return os.path.join(self.settings["output_dir"], self.job_id + ".png")
+
+
+def load_spec(path: str) -> dict:
+    """
+    Lee una especificación JSON o TOML (por extensión). TOML usa tomllib (Python 3.11+)
+    o, en versiones anteriores, el paquete opcional 'tomli'.
+    """
+    if path.endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ImportError("Leer TOML requiere Python 3.11+ o 'pip install tomli' (o use JSON)") from None
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    with open(path) as f:
+        return json.load(f)
+
+
+def _slug(value) -> str:
+    text = json.dumps(value) if isinstance(value, (list, dict)) else str(value)
+    return re.sub(r"[^A-Za-z0-9.\-]+", "-", text).strip("-")
+
+
+def _constructor_params(cls: type) -> set:
+    return {name for name in inspect.signature(cls.__init__).parameters if name != "self"}
+
+
+def expand_jobs(spec: dict, base_dir: str = ".") -> list[JobSpec]:
+    """
+    Expande cada entrada de [[jobs]] en un trabajo por punto de su malla 'grid'.
+
+    Args:
+        spec (dict): Especificación cargada con load_spec.
+        base_dir (str): Directorio base para resolver un output_dir relativo.
+
+    Returns:
+        list: Trabajos concretos, con job_id = nombre + valores de la malla.
+    """
+    from src.systems.registry import get_system
+
+    settings = {**DEFAULT_SETTINGS, **spec.get("settings", {})}
+    jobs = []
+    seen = set()
+    for entry in spec.get("jobs", []):
+        for key in ("name", "system", "method"):
+            if key not in entry:
+                raise ValueError(f"Trabajo sin '{key}': {entry}")
+        job_settings = {**settings, **{k: v for k, v in entry.items() if k in DEFAULT_SETTINGS}}
+        if job_settings["format"] not in FORMATS:
+            raise ValueError(f"Formato desconocido {job_settings['format']!r}. Use uno de {FORMATS}")
+        job_settings["output_dir"] = os.path.normpath(os.path.join(base_dir, job_settings["output_dir"]))
+
+        cls = get_system(entry["system"])
+        if not callable(getattr(cls, entry["method"], None)) or entry["method"].startswith("_"):
+            raise ValueError(f"{cls.__name__} no tiene un método público '{entry['method']}'")
+        # Los métodos estáticos no necesitan instancia: todo va al método
+        is_static = isinstance(inspect.getattr_static(cls, entry["method"]), staticmethod)
+        init_names = set() if is_static else _constructor_params(cls)
+        # La política de tipos global solo se aplica a los métodos que la aceptan
+        defaults = {}
+        if job_settings["output_dtype"] and "output_dtype" in inspect.signature(getattr(cls, entry["method"])).parameters:
+            defaults["output_dtype"] = job_settings["output_dtype"]
+
+        grid = entry.get("grid", {})
+        names = list(grid)
+        for values in itertools.product(*(grid[name] for name in names)):
+            point = dict(zip(names, values))
+            merged = {**defaults, **entry.get("params", {}), **point}
+            suffix = "_".join(f"{name}={_slug(value)}" for name, value in point.items())
+            job_id = entry["name"] + (f"__{suffix}" if suffix else "")
+            if job_id in seen:
+                raise ValueError(f"Trabajo duplicado: {job_id}")
+            seen.add(job_id)
+            jobs.append(JobSpec(
+                job_id=job_id,
+                system=entry["system"],
+                method=entry["method"],
+                init={k: v for k, v in merged.items() if k in init_names},
+                params={k: v for k, v in merged.items() if k not in init_names},
+                settings=job_settings,
+            ))
+    return jobs
@@ -0,0 +1,91 @@
+"""
+Exactitud de los modos de salida compactos (float32 / uint16) frente a la referencia float64.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.precision                      # imprime la tabla
+    python -m benchmarks.precision --output precision.json
+
+Para cada generador se compara la misma llamada (misma semilla) con output_dtype="float64"
+y con cada modo compacto: error absoluto máximo, error máximo relativo al rango de los datos
+(float32) o al rango cuantizado (uint16) y fracción de bytes respecto a float64.
+Sale con código 1 si algún error supera su cota:
+  float32: 1e-6 del rango (redondeo a float32; en el juego del caos, además, iteración en float32)
+  uint16:  medio paso de cuantización (1 / 131070 del rango) más el redondeo float32 intermedio
+"""
+import argparse
+import json
+import sys
+import numpy as np
+
+from src.systems.discrete import LogisticMap
+from src.systems.continuous import LorenzSystem
+from src.systems.fractals import ChaosGame
+from src.simulation.precision import Quantized
+
+MODES = ("float32", "uint16")
+BOUNDS = {"float32": 1e-6, "uint16": 0.5 / 65535 + 1e-7}
+
+
+def _cases() -> list[tuple]:
+    """(nombre, función output_dtype -> resultado) de cada generador."""
+    states = np.random.default_rng(0).normal(1.0, 0.01, size=(100, 3))
+    return [
+        ("logistic.simulate", lambda d: LogisticMap(r=3.9).simulate(0.1, 10_000, output_dtype=d)),
+        ("logistic.simulate_batch", lambda d: LogisticMap.simulate_batch(
+            np.linspace(0.1, 0.9, 1000), 3.9, 1000, output_dtype=d)),
+        ("logistic.generate_bifurcation_data", lambda d: LogisticMap.generate_bifurcation_data(
+            2.5, 4.0, 1000, 100, 800, seed=0, max_period=32, output_dtype=d)[:2]),
+        ("lorenz.simulate", lambda d: LorenzSystem().simulate(1.0, 1.0, 1.0, 30, output_dtype=d)),
+        ("lorenz.simulate_ensemble", lambda d: LorenzSystem().simulate_ensemble(states, 10, output_dtype=d)),
+        ("chaos_game.generate_points", lambda d: ChaosGame().generate_points(1_000_000, seed=0, output_dtype=d)),
+    ]
+
+
+def compare(reference, result) -> dict:
+    """Errores de result frente a reference (arrays o tuplas de arrays / Quantized)."""
+    references = reference if isinstance(reference, tuple) else (reference,)
+    results = result if isinstance(result, tuple) else (result,)
+    abs_error = rel_error = 0.0
+    for ref, out in zip(references, results):
+        ref = np.asarray(ref, dtype=np.float64)
+        error = np.abs(np.asarray(out, dtype=np.float64) - ref)
+        # uint16 se mide contra su propio rango cuantizado (p.ej. [0, 1] en el mapa logístico)
+        span = float(np.max(out.scale)) * 65535 if isinstance(out, Quantized) else float(np.ptp(ref))
+        span = max(span, np.finfo(float).tiny)
+        abs_error = max(abs_error, float(error.max()))
+        rel_error = max(rel_error, float(error.max()) / span)
+    return {
+        "max_abs_error": abs_error,
+        "max_rel_range_error": rel_error,
+        "bytes_ratio": sum(out.nbytes for out in results) / sum(np.asarray(ref).nbytes for ref in references),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Exactitud de output_dtype frente a float64")
+    parser.add_argument("--output", default=None, help="Guardar los resultados en este JSON")
+    args = parser.parse_args(argv)
+
+    report = {}
+    failed = []
+    print(f"{'generador':<38s} {'modo':<8s} {'error abs':>10s} {'error/rango':>12s} {'bytes':>6s}")
+    for name, run in _cases():
+        reference = run("float64")
+        for mode in MODES:
+            row = compare(reference, run(mode))
+            row["bound"] = BOUNDS[mode]
+            report[f"{name}[{mode}]"] = row
+            ok = row["max_rel_range_error"] <= row["bound"]
+            if not ok:
+                failed.append(f"{name}[{mode}]")
+            print(f"{name:<38s} {mode:<8s} {row['max_abs_error']:10.2e} {row['max_rel_range_error']:12.2e} "
+                  f"{row['bytes_ratio']:6.2f}" + ("" if ok else "  << supera la cota"))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
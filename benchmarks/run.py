@@ -0,0 +1,156 @@
+"""
+Suite de benchmarks con líneas base de regresión.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.run                           # mide y guarda benchmarks/results.json
+    python -m benchmarks.run --save-baseline           # además guarda la línea base
+    python -m benchmarks.run --baseline benchmarks/baseline.json --tolerance 0.25
+    python -m benchmarks.run --filter bifurcation      # solo las cargas cuyo nombre contiene el texto
+    python -m benchmarks.run --require-baseline        # en CI: sin línea base es un fallo
+
+Sale con código 1 si alguna carga es más lenta o usa más memoria que la línea base por
+encima de la tolerancia relativa y, además, de un margen absoluto (--min-time-ms,
+--min-memory-mib), para que el ruido de las cargas de menos de un milisegundo no cuente
+como regresión. La memoria de las cargas que corren en un subproceso no se compara.
+
+benchmarks/baseline.json es la línea base de referencia (su 'meta' indica la máquina).
+Los tiempos solo son comparables en el mismo hardware: en otra máquina, o tras un cambio
+de rendimiento intencionado, regenérela con --save-baseline y confírmela con el cambio.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+from benchmarks.workloads import build_workloads
+
+DEFAULT_RESULTS = os.path.join(os.path.dirname(__file__), "results.json")
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def measure(workload, repeat: int) -> dict:
+    """
+    Mide una carga: mejor tiempo de pared en 'repeat' ejecuciones (sin tracemalloc, que
+    ralentiza) y memoria pico en una ejecución adicional instrumentada.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        workload.run()
+        times.append(time.perf_counter() - start)
+
+    peak = None
+    if workload.measure_memory:
+        tracemalloc.start()
+        try:
+            workload.run()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    wall = min(times)
+    return {
+        "group": workload.group,
+        "wall_time_s": wall,
+        "peak_memory_bytes": peak,
+        "points": workload.points,
+        "throughput_points_per_s": workload.points / wall if wall > 0 else float("inf"),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float, min_time_s: float = 0.005,
+            min_memory_bytes: int = 2**20) -> list[str]:
+    """
+    Lista de regresiones (tiempo o memoria) respecto a la línea base. Una métrica regresa si
+    supera a la base en más de 'tolerance' (relativa) y también en más del margen absoluto.
+    """
+    regressions = []
+    floors = {"wall_time_s": min_time_s, "peak_memory_bytes": min_memory_bytes}
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        for metric, floor in floors.items():
+            if current.get(metric) is None or reference.get(metric) is None:
+                continue
+            limit = max(reference[metric] * (1.0 + tolerance), reference[metric] + floor)
+            if current[metric] > limit:
+                regressions.append(f"{name}: {metric} {current[metric]:.4g} > {limit:.4g} "
+                                   f"(base {reference[metric]:.4g}, tolerancia {tolerance:.0%})")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks de M3: Dynamical Systems")
+    parser.add_argument("--output", default=DEFAULT_RESULTS, help="JSON de resultados")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="JSON de línea base")
+    parser.add_argument("--save-baseline", action="store_true", help="Guardar los resultados como línea base")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Regresión relativa permitida")
+    parser.add_argument("--min-time-ms", type=float, default=5.0, help="Regresión absoluta mínima de tiempo")
+    parser.add_argument("--min-memory-mib", type=float, default=1.0, help="Regresión absoluta mínima de memoria")
+    parser.add_argument("--require-baseline", action="store_true", help="Fallar si no existe la línea base")
+    parser.add_argument("--repeat", type=int, default=5, help="Ejecuciones cronometradas por carga")
+    parser.add_argument("--filter", default="", help="Subcadena del nombre de las cargas a ejecutar")
+    args = parser.parse_args(argv)
+
+    results = {}
+    workloads = {}
+    for workload in build_workloads():
+        if args.filter not in workload.name:
+            continue
+        workloads[workload.name] = workload
+        results[workload.name] = measure(workload, args.repeat)
+        r = results[workload.name]
+        memory = "-" if r["peak_memory_bytes"] is None else f"{r['peak_memory_bytes'] / 2**20:.1f}"
+        print(f"{workload.name:<55} {r['wall_time_s'] * 1e3:10.2f} ms "
+              f"{memory:>9} MiB {r['throughput_points_per_s']:14.3e} pts/s")
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Línea base guardada en {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Sin línea base en {args.baseline}: use --save-baseline para crearla")
+        return 1 if args.require_baseline else 0
+
+    with open(args.baseline) as f:
+        stored = json.load(f)
+    machine = {key: stored.get("meta", {}).get(key) for key in ("platform", "cpu_count")}
+    if machine != {key: report["meta"][key] for key in machine}:
+        print(f"Aviso: la línea base se midió en otra máquina ({machine}); los tiempos pueden no ser comparables")
+    limits = (args.tolerance, args.min_time_ms / 1e3, int(args.min_memory_mib * 2**20))
+    regressions = compare(results, stored["results"], *limits)
+    if regressions:
+        # Confirmación: las cargas sospechosas se miden otra vez y se queda el mejor tiempo,
+        # para que una interrupción puntual de la máquina no se reporte como regresión
+        suspects = {line.split(":")[0] for line in regressions}
+        for name in suspects:
+            retry = measure(workloads[name], args.repeat)
+            results[name]["wall_time_s"] = min(results[name]["wall_time_s"], retry["wall_time_s"])
+        regressions = compare(results, stored["results"], *limits)
+    for line in regressions:
+        print(f"REGRESIÓN {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+Cargas de trabajo de referencia: las que ejecuta el dashboard y variantes escaladas.
+Cada entrada define cómo preparar y ejecutar el cálculo y cuántos "puntos" produce
+(para calcular el throughput en puntos/s).
+"""
+import os
+import subprocess
+import sys
+import numpy as np
+from dataclasses import dataclass
+from typing import Callable
+
+from src.systems.discrete import LogisticMap
+from src.systems.continuous import LorenzSystem
+from src.systems.fractals import ChaosGame
+
+
+@dataclass
+class Workload:
+    """
+    Un cálculo medible: run() ejecuta el trabajo completo y points es su tamaño de salida.
+    measure_memory=False para cargas que corren en otro proceso (tracemalloc solo ve el actual).
+    """
+    name: str
+    run: Callable[[], object]
+    points: int
+    group: str
+    measure_memory: bool = True
+
+
+def _logistic_simulate(steps: int) -> Callable:
+    # Instancia nueva en cada ejecución: LogisticMap reutiliza el prefijo de la corrida anterior
+    return lambda: LogisticMap(r=3.9).simulate(x0=0.1, steps=steps)
+
+
+# Módulos que el dashboard importa antes de pintar la portada, frente a la importación
+# ansiosa de todos los motores y sus dependencias numéricas
+STARTUP_IMPORTS = ["numpy", "src.systems.registry", "src.simulation.cache", "src.simulation.profiling",
+                   "src.simulation.jobs", "src.visualization.render_prep"]
+EAGER_IMPORTS = STARTUP_IMPORTS + ["src.systems.discrete", "src.systems.continuous", "src.systems.fractals",
+                                   "scipy.integrate"]
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _cold_import(modules: list[str]) -> Callable:
+    # Intérprete nuevo en cada ejecución: mide la importación en frío (tiempo hasta la primera pintura)
+    code = "; ".join(f"import {name}" for name in modules)
+    return lambda: subprocess.run([sys.executable, "-c", code], cwd=_REPO_ROOT, check=True)
+
+
+def build_workloads() -> list[Workload]:
+    """Lista completa de cargas de trabajo (tamaño dashboard primero, luego escaladas)."""
+    workloads = []
+
+    # --- Arranque en frío del dashboard ---
+    workloads.append(Workload("startup.import[lazy]", _cold_import(STARTUP_IMPORTS), 1, "startup",
+                              measure_memory=False))
+    workloads.append(Workload("startup.import[eager]", _cold_import(EAGER_IMPORTS), 1, "startup",
+                              measure_memory=False))
+
+    # --- Mapa logístico: series de tiempo (tab II) y sensibilidad (tab IV) ---
+    for steps in (100, 10_000, 1_000_000):
+        workloads.append(Workload(f"logistic.simulate[steps={steps}]", _logistic_simulate(steps),
+                                  steps, "LogisticMap.simulate"))
+    for n_traj, steps in ((2, 60), (10_000, 1_000)):
+        x0 = np.linspace(0.1, 0.9, n_traj)
+        workloads.append(Workload(f"logistic.simulate_batch[n={n_traj},steps={steps}]",
+                                  lambda x0=x0, steps=steps: LogisticMap.simulate_batch(x0, 3.9, steps),
+                                  n_traj * steps, "LogisticMap.simulate"))
+
+    # --- Diagrama de bifurcación (tab III) ---
+    for steps, last_n, resolution in ((1000, 100, 800), (2000, 500, 5000)):
+        workloads.append(Workload(
+            f"bifurcation.points[res={resolution},last_n={last_n}]",
+            lambda s=steps, n=last_n, r=resolution: LogisticMap.generate_bifurcation_data(2.5, 4.0, s, n, r, seed=0),
+            last_n * resolution, "LogisticMap.generate_bifurcation_data"))
+    for output_dtype in ("float32", "uint16"):
+        workloads.append(Workload(
+            f"bifurcation.points[res=5000,last_n=500,dtype={output_dtype}]",
+            lambda d=output_dtype: LogisticMap.generate_bifurcation_data(2.5, 4.0, 2000, 500, 5000, seed=0,
+                                                                         output_dtype=d),
+            500 * 5000, "LogisticMap.generate_bifurcation_data"))
+    for steps, last_n, resolution in ((2000, 1000, 2000), (2000, 1000, 20_000)):
+        workloads.append(Workload(
+            f"bifurcation.density[res={resolution},last_n={last_n}]",
+            lambda s=steps, n=last_n, r=resolution: LogisticMap.generate_bifurcation_density(
+                2.5, 4.0, s, n, r, x_bins=800, max_period=32, seed=0),
+            last_n * resolution, "LogisticMap.generate_bifurcation_data"))
+
+    # --- Lorenz (tab V) ---
+    for duration in (30, 300):
+        workloads.append(Workload(f"lorenz.simulate[duration={duration}]",
+                                  lambda d=duration: LorenzSystem(rho=28.0).simulate(1.0, 1.0, 1.0, d),
+                                  int(duration / 0.01), "LorenzSystem.simulate"))
+    for n_members in (100, 1000):
+        states = np.random.default_rng(0).normal(1.0, 0.01, size=(n_members, 3))
+        workloads.append(Workload(f"lorenz.simulate_ensemble[n={n_members},duration=10]",
+                                  lambda s=states: LorenzSystem().simulate_ensemble(s, 10),
+                                  n_members * 1000, "LorenzSystem.simulate"))
+    for output_dtype in ("float32", "uint16"):
+        workloads.append(Workload(f"lorenz.simulate_ensemble[n=1000,duration=10,dtype={output_dtype}]",
+                                  lambda s=states, d=output_dtype: LorenzSystem().simulate_ensemble(
+                                      s, 10, output_dtype=d),
+                                  1000 * 1000, "LorenzSystem.simulate"))
+
+    # --- Juego del caos (tab VI) ---
+    for n_steps in (10_000, 50_000, 1_000_000, 10_000_000):
+        workloads.append(Workload(f"chaos_game.generate_points[n={n_steps}]",
+                                  lambda n=n_steps: ChaosGame().generate_points(n, seed=0),
+                                  n_steps, "ChaosGame.generate_points"))
+    for output_dtype in ("float32", "uint16"):
+        workloads.append(Workload(f"chaos_game.generate_points[n=10000000,dtype={output_dtype}]",
+                                  lambda d=output_dtype: ChaosGame().generate_points(10_000_000, seed=0,
+                                                                                     output_dtype=d),
+                                  10_000_000, "ChaosGame.generate_points"))
+    workloads.append(Workload("chaos_game.accumulate_density[n=10000000]",
+                              lambda: ChaosGame().accumulate_density(10_000_000, seed=0),
+                              10_000_000, "ChaosGame.generate_points"))
+
+    # --- Dimensiones fractales (conteo de cajas + correlación, por streaming) ---
+    workloads.append(Workload("chaos_game.fractal_dimensions[n=1000000]",
+                              lambda: ChaosGame().fractal_dimensions(1_000_000, seed=0),
+                              1_000_000, "dimensions"))
+    workloads.append(Workload("lorenz.fractal_dimensions[duration=200,n=64]",
+                              lambda: LorenzSystem().fractal_dimensions(200, seed=0),
+                              64 * 20_000, "dimensions"))
+
+    return workloads
@@ -1,16 +1,63 @@
 import streamlit as st
-import plotly.graph_objects as go
 import numpy as np
 import sys
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 
 # Agregamos el directorio raiz para importar nuestros modulos de logica
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-# Importamos TODOS nuestros sistemas
-from src.systems.discrete import LogisticMap
-from src.systems.continuous import LorenzSystem
-from src.systems.fractals import ChaosGame
+# Los sistemas y Plotly se importan en su primer uso: la portada (texto estático) se
+# pinta sin esperar a SciPy ni a Plotly
+from src.systems.registry import LazyModule, get_system, warm_up_in_background
+from src.simulation.cache import ResultCache
+from src.simulation.profiling import Profiler, set_active_profiler
+from src.simulation.jobs import JobManager
+from src.visualization.render_prep import decimate_line, rasterize, pool_counts, shade, pixel_centers
+
+# Caché en disco compartida entre sesiones y reruns (clave = sistema + parámetros + semilla)
+cache = ResultCache()
+go = LazyModule("plotly.graph_objects")
+
+# Trabajos pesados en segundo plano: si un resultado tarda más que FAST_PATH_S, se muestra
+# el progreso y el script se vuelve a ejecutar cada POLL_INTERVAL_S hasta que termine
+FAST_PATH_S = 0.15
+POLL_INTERVAL_S = 0.25
+
+
+@st.cache_resource
+def job_executor() -> ThreadPoolExecutor:
+    """Hilos de trabajo compartidos por todas las sesiones: cerrar una no deja un executor huérfano."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="m3-job")
+
+
+def render(fig, stage: str) -> None:
+    """Envía la figura al navegador midiendo la serialización de Plotly (si hay diagnóstico)."""
+    with profiler.stage(f"plotly.{stage}"):
+        st.plotly_chart(fig, use_container_width=True)
+
+
+def await_job(job, label: str):
+    """
+    Devuelve el resultado del trabajo si termina enseguida; si no, muestra su progreso y
+    programa un rerun (los widgets siguen respondiendo mientras tanto).
+    """
+    try:
+        return job.result(timeout=FAST_PATH_S)
+    except FutureTimeout:
+        st.progress(job.progress, text=label)
+        time.sleep(POLL_INTERVAL_S)
+        st.rerun()
+
+
+def density_heatmap(counts: np.ndarray, bounds: tuple, color: str) -> "go.Heatmap":
+    """Imagen de densidad de tamaño acotado (uint8) en lugar de un marcador por punto."""
+    image = shade(pool_counts(counts))
+    x_centers, y_centers = pixel_centers(bounds, image.shape)
+    return go.Heatmap(x=x_centers, y=y_centers, z=image, colorscale=[[0, 'white'], [1, color]],
+                      showscale=False, hoverinfo='skip')
+
 
 # -----------------------------------------------------------------------------
 # CONFIGURACIÓN DE PÁGINA Y CSS
@@ -91,10 +138,33 @@ tab_names = [
     "VII. Matriz Estratégica",
     "VIII. Conclusiones"
 ]
-tabs = st.tabs(tab_names)
+# Navegación por secciones: a diferencia de st.tabs, solo se ejecuta el código de la sección visible
+section = st.radio("Sección", tab_names, horizontal=True, key="section", label_visibility="collapsed")
+
+# Un trabajo por sección en curso; cambiar de sección cancela el trabajo de las demás.
+# Un trabajo que falló se relanza en el siguiente rerun en lugar de repetir su error
+if "jobs" not in st.session_state:
+    st.session_state["jobs"] = JobManager(executor=job_executor())
+jobs = st.session_state["jobs"]
+jobs.cancel_all_except(section)
+
+# Diagnóstico opcional: tiempos por etapa de esta ejecución del script. Cada sesión tiene
+# su propio perfilador (activado en el contexto del script y heredado por sus trabajos),
+# así que el diagnóstico de una sesión no enciende, apaga ni borra el de otra
+if "profiler" not in st.session_state:
+    st.session_state["profiler"] = Profiler()
+profiler = st.session_state["profiler"]
+set_active_profiler(profiler)
+with st.sidebar:
+    diagnostics = st.checkbox("Diagnóstico de rendimiento", value=False, key="diag")
+if diagnostics:
+    profiler.enable()
+    profiler.reset()
+else:
+    profiler.disable()
 
 # --- TAB 1: PLANTEAMIENTO ---
-with tabs[0]:
+if section == tab_names[0]:
     st.header("I. Definición del Problema")
     st.markdown("""
     <div class="report-text">
@@ -107,7 +177,7 @@ with tabs[0]:
     """, unsafe_allow_html=True)
 
 # --- TAB 2: EVOLUCIÓN TEMPORAL ---
-with tabs[1]:
+if section == tab_names[1]:
     st.header("II. Análisis Descriptivo: Series de Tiempo")
     col_ctrl, col_viz = st.columns([1, 3])
     with col_ctrl:
@@ -115,60 +185,101 @@ with tabs[1]:
         r_param = st.slider("Tasa de Crecimiento (r)", 0.0, 4.0, 3.2, 0.01, key="t2_r")
         steps = st.slider("Iteraciones", 50, 200, 100, key="t2_s")
     with col_viz:
-        model = LogisticMap(r=r_param)
+        # Modelo por sesión: al subir las iteraciones solo se iteran los pasos nuevos
+        model = st.session_state.get("t2_model")
+        if model is None or model.r != r_param:
+            model = get_system("logistic")(r=r_param)
+            st.session_state["t2_model"] = model
         data = model.simulate(x0=0.1, steps=steps)
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(y=data, mode='lines+markers', line=dict(color='#2c3e50', width=1.5), marker=dict(size=4, color='#E63946'), name='Trayectoria'))
-        fig.update_layout(title=f"Evolución Temporal (r = {r_param})", xaxis_title="Tiempo (t)", yaxis_title="Estado (x)", template="plotly_white", height=450)
-        st.plotly_chart(fig, use_container_width=True)
+        with profiler.stage("figure.series"):
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(y=data, mode='lines+markers', line=dict(color='#2c3e50', width=1.5), marker=dict(size=4, color='#E63946'), name='Trayectoria'))
+            fig.update_layout(title=f"Evolución Temporal (r = {r_param})", xaxis_title="Tiempo (t)", yaxis_title="Estado (x)", template="plotly_white", height=450)
+        render(fig, "series")
     diagnosis = "Estabilidad" if r_param < 3.0 else "Periodicidad" if r_param < 3.56 else "Caos"
     st.markdown(f"""<div class="observation-box"><b>Discusión:</b> Régimen detectado: {diagnosis}.</div>""", unsafe_allow_html=True)
 
 # --- TAB 3: BIFURCACIÓN ---
-with tabs[2]:
+if section == tab_names[2]:
     st.header("III. Estructura Global del Caos")
+    render_mode = st.radio("Modo de render", ["Puntos", "Densidad (alta resolución)"], horizontal=True, key="t3_mode")
     if st.button("Generar Diagrama de Bifurcación"):
-        with st.spinner("Calculando estructura..."):
-            r_v, x_v = LogisticMap.generate_bifurcation_data(2.5, 4.0, 1000, 100, 800)
-            fig = go.Figure(go.Scattergl(x=r_v, y=x_v, mode='markers', marker=dict(size=1, color='black', opacity=0.1)))
-            fig.update_layout(title="Diagrama de Bifurcación", xaxis_title="r", yaxis_title="x", template="plotly_white", height=600, showlegend=False)
-            st.plotly_chart(fig, use_container_width=True)
+        st.session_state["t3_requested"] = True
+    if st.session_state.get("t3_requested"):
+        LogisticMap = get_system("logistic")
+        if render_mode == "Puntos":
+            job = jobs.submit(section, render_mode, cache.call, LogisticMap, 'generate_bifurcation_data',
+                              2.5, 4.0, 1000, 100, 800, seed=0, chunk_size=100, output_dtype="float32")
+            r_v, x_v = await_job(job, "Calculando estructura...")
+            with profiler.stage("figure.bifurcation") as stage:
+                # Los puntos se agregan en una imagen fija: una columna de píxeles por valor de r
+                counts, bounds = rasterize(r_v, x_v, shape=(600, 800), bounds=(2.5, 4.0, 0.0, 1.0))
+                stage.annotate(counts)
+                fig = go.Figure(density_heatmap(counts, bounds, 'black'))
+        else:
+            # Histograma 2-D: la memoria depende de la rejilla, no del número de iteraciones
+            job = jobs.submit(section, render_mode, cache.call, LogisticMap, 'generate_bifurcation_density',
+                              2.5, 4.0, 2000, 1000, 2000, x_bins=800, max_period=32, seed=0, chunk_size=200)
+            r_v, x_edges, counts, _ = await_job(job, "Calculando estructura...")
+            with profiler.stage("figure.bifurcation") as stage:
+                stage.annotate(counts)
+                bounds = (r_v[0], r_v[-1], x_edges[0], x_edges[-1])
+                fig = go.Figure(density_heatmap(counts.T, bounds, 'black'))
+        fig.update_layout(title="Diagrama de Bifurcación", xaxis_title="r", yaxis_title="x", template="plotly_white", height=600, showlegend=False)
+        render(fig, "bifurcation")
     else:
         st.info("Presione el botón para visualizar la ruta al caos.")
 
 # --- TAB 4: SENSIBILIDAD ---
-with tabs[3]:
+if section == tab_names[3]:
     st.header("IV. Sensibilidad a Condiciones Iniciales")
     col_ctrl, col_viz = st.columns([1, 3])
     with col_ctrl:
         r_bf = st.slider("Parámetro r", 3.5, 4.0, 3.9, 0.01, key="t4_r")
         eps = st.select_slider("Error Inicial", options=[1e-5, 1e-4, 1e-3], value=1e-5)
+        # Horizonte de predictibilidad: tiempo para que el error inicial crezca hasta 0.1
+        LogisticMap = get_system("logistic")
+        lyap = LogisticMap.lyapunov_exponents(r_bf, steps=5000, seed=0)[0]
+        st.metric("Exponente de Lyapunov (λ)", f"{lyap:.3f}")
+        if lyap > 0:
+            st.metric("Horizonte de Lyapunov", f"{np.log(0.1 / eps) / lyap:.1f} pasos")
     with col_viz:
-        m = LogisticMap(r=r_bf)
-        tb = m.simulate(0.2, 60)
-        tp = m.simulate(0.2 + eps, 60)
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(y=tb, name='Base', line=dict(color='#2c3e50')))
-        fig.add_trace(go.Scatter(y=tp, name='Perturbado', line=dict(color='#E63946', dash='dash')))
-        fig.update_layout(title="Divergencia Exponencial", template="plotly_white", height=500)
-        st.plotly_chart(fig, use_container_width=True)
+        # Base y perturbada en una sola pasada vectorizada
+        tb, tp = LogisticMap.simulate_batch([0.2, 0.2 + eps], r_bf, 60)
+        with profiler.stage("figure.sensitivity"):
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(y=tb, name='Base', line=dict(color='#2c3e50')))
+            fig.add_trace(go.Scatter(y=tp, name='Perturbado', line=dict(color='#E63946', dash='dash')))
+            fig.update_layout(title="Divergencia Exponencial", template="plotly_white", height=500)
+        render(fig, "sensitivity")
     st.markdown("""<div class="prescription-box" style="border-left-color: #ff9800;"><b>Riesgo:</b> La divergencia rápida confirma la imposibilidad de predicción a largo plazo (Horizonte de Lyapunov limitado).</div>""", unsafe_allow_html=True)
 
 # --- TAB 5: LORENZ 3D ---
-with tabs[4]:
+if section == tab_names[4]:
     st.header("V. Sistemas Continuos: Atractor de Lorenz")
     col_ctrl, col_viz = st.columns([1, 3])
     with col_ctrl:
         rho = st.slider("Rayleigh (Caos > 24.7)", 0.0, 50.0, 28.0, 0.5)
-        dur = st.slider("Duración", 10, 50, 30)
+        dur = st.slider("Duración", 10, 200, 30)
     with col_viz:
-        traj = LorenzSystem(rho=rho).simulate(1.0, 1.0, 1.0, dur)
-        fig = go.Figure(go.Scatter3d(x=traj[:,0], y=traj[:,1], z=traj[:,2], mode='lines', line=dict(color=traj[:,2], colorscale='Viridis', width=2), opacity=0.8))
-        fig.update_layout(title="Espacio de Fase 3D", scene=dict(bgcolor='white'), height=600, margin=dict(t=0,b=0,l=0,r=0))
-        st.plotly_chart(fig, use_container_width=True)
+        # Simulación reanudable por sesión: alargar la duración solo integra el tramo nuevo
+        run = st.session_state.get("t5_run")
+        if run is None or run.system.rho != rho:
+            run = get_system("lorenz")(rho=rho).start(1.0, 1.0, 1.0)
+            st.session_state["t5_run"] = run
+        # Solo se integra el tramo que falta; un cambio de rho o duración cancela el trabajo anterior
+        job = jobs.submit(section, (rho, dur), run.extend_to, dur)
+        traj = await_job(job, "Integrando trayectoria...")
+        with profiler.stage("figure.lorenz") as stage:
+            # LTTB: a lo sumo MAX_LINE_POINTS vértices sin importar la duración integrada
+            line, _ = decimate_line(traj)
+            stage.annotate(line)
+            fig = go.Figure(go.Scatter3d(x=line[:,0], y=line[:,1], z=line[:,2], mode='lines', line=dict(color=line[:,2], colorscale='Viridis', width=2), opacity=0.8))
+            fig.update_layout(title="Espacio de Fase 3D", scene=dict(bgcolor='white'), height=600, margin=dict(t=0,b=0,l=0,r=0))
+        render(fig, "lorenz")
 
 # --- TAB 6: FRACTALES (NUEVO) ---
-with tabs[5]:
+if section == tab_names[5]:
     st.header("VI. Geometría Fractal: Orden en el Azar")
     st.markdown("""
     <div class="report-text">
@@ -181,38 +292,32 @@ with tabs[5]:
     
     with col_fr_ctrl:
         st.subheader("Simulación Estocástica")
-        n_points = st.slider("Número de Puntos (Iteraciones)", 1000, 50000, 10000, step=1000, key="t6_n")
+        n_points = st.slider("Número de Puntos (Iteraciones)", 10000, 2000000, 200000, step=10000, key="t6_n")
         st.write("Aumente el número de puntos para ver emerger la estructura nítida.")
         
     with col_fr_viz:
-        # Instanciamos y ejecutamos el juego
-        chaos_game = ChaosGame()
-        fractal_points = chaos_game.generate_points(n_steps=n_points)
-        
-        fig_fr = go.Figure()
-        fig_fr.add_trace(go.Scattergl(
-            x=fractal_points[:, 0],
-            y=fractal_points[:, 1],
-            mode='markers',
-            marker=dict(
-                size=1.5,
-                color='#2A9D8F', # Un color verde azulado elegante
-                opacity=0.6
-            ),
-            name='Punto Iterado'
-        ))
-        
-        fig_fr.update_layout(
-            title="Emergencia del Triángulo de Sierpinski",
-            xaxis=dict(visible=False), # Ocultamos ejes para limpieza visual
-            yaxis=dict(visible=False, scaleanchor="x", scaleratio=1), # Mantener aspecto cuadrado
-            template="plotly_white",
-            height=600,
-            showlegend=False,
-             margin=dict(t=50,b=20,l=20,r=20)
-        )
-        st.plotly_chart(fig_fr, use_container_width=True)
+        # Instanciamos y ejecutamos el juego: los puntos se agregan por bloques en una imagen fija
+        chaos_game = get_system("chaos_game")()
+        job = jobs.submit(section, n_points, cache.call, chaos_game, 'accumulate_density', n_points,
+                          resolution=(600, 600), seed=0, block_size=250000)
+        fractal_counts, fractal_bounds = await_job(job, "Iterando el juego del caos...")
         
+        with profiler.stage("figure.fractal") as stage:
+            stage.annotate(fractal_counts)
+            fig_fr = go.Figure()
+            fig_fr.add_trace(density_heatmap(fractal_counts, fractal_bounds, '#2A9D8F')) # Un color verde azulado elegante
+
+            fig_fr.update_layout(
+                title="Emergencia del Triángulo de Sierpinski",
+                xaxis=dict(visible=False), # Ocultamos ejes para limpieza visual
+                yaxis=dict(visible=False, scaleanchor="x", scaleratio=1), # Mantener aspecto cuadrado
+                template="plotly_white",
+                height=600,
+                showlegend=False,
+                 margin=dict(t=50,b=20,l=20,r=20)
+            )
+        render(fig_fr, "fractal")
+
     st.markdown("""
     <div class="observation-box">
         <b>Conclusión Visual:</b><br>
@@ -221,8 +326,20 @@ with tabs[5]:
     </div>
     """, unsafe_allow_html=True)
 
+    # Cuantificación de la autosimilaridad: se calcula después de pintar la figura y el texto
+    with col_fr_ctrl:
+        # Unas log4(n) escalas quedan por debajo de la saturación: con niveles más finos casi
+        # cada punto ocupa su propia caja y la pendiente cae (p.ej. 1.50 con 10k puntos y nivel 8)
+        max_level = int(np.log(n_points) / np.log(4))
+        dim_job = jobs.submit(f"{section}:dimension", n_points, cache.call, chaos_game, 'fractal_dimensions',
+                              n_points, max_level=max_level, seed=0)
+        dims = await_job(dim_job, "Estimando dimensión fractal...")
+        st.metric("Dimensión (conteo de cajas)", f"{dims['box_dimension']:.3f}")
+        st.metric("Dimensión de correlación", f"{dims['correlation_dimension']:.3f}")
+        st.caption(f"Valor teórico del triángulo de Sierpinski: log 3 / log 2 ≈ {np.log(3) / np.log(2):.3f}")
+
 # --- TAB 7: ESTRATEGIA ---
-with tabs[6]:
+if section == tab_names[6]:
     st.header("VII. Matriz de Decisión Estratégica")
     st.markdown("""
     <table class="logic-table">
@@ -236,6 +353,28 @@ with tabs[6]:
     """, unsafe_allow_html=True)
 
 # --- TAB 8: CONCLUSIONES ---
-with tabs[7]:
+if section == tab_names[7]:
     st.header("VIII. Síntesis Final")
     st.markdown("""<div class="report-text">Hemos demostrado matemáticamente que el caos no es desorden absoluto. Es un comportamiento complejo generado por reglas simples, sensible a condiciones iniciales, pero confinado en estructuras fractales elegantes. Comprender esto es el primer paso para navegar la incertidumbre real.</div>""", unsafe_allow_html=True)
+
+# -----------------------------------------------------------------------------
+# PANEL DE DIAGNÓSTICO (OPCIONAL)
+# -----------------------------------------------------------------------------
+if diagnostics:
+    st.markdown("---")
+    st.subheader("Diagnóstico de rendimiento")
+    st.caption("Tiempos de esta ejecución del script: simulación, construcción de figuras y serialización de Plotly.")
+    st.dataframe(profiler.summary(), use_container_width=True)
+    st.download_button("Exportar log (JSON)", profiler.to_json(), file_name="m3_profile.json", mime="application/json")
+
+
+# -----------------------------------------------------------------------------
+# CALENTAMIENTO (UNA VEZ POR SERVIDOR, TRAS LA PRIMERA PINTURA)
+# -----------------------------------------------------------------------------
+@st.cache_resource
+def start_warm_up():
+    """Importa los motores y precalcula los resultados por defecto en segundo plano."""
+    return warm_up_in_background(cache, preload=("scipy.integrate", "plotly.graph_objects"))
+
+
+start_warm_up()
@@ -0,0 +1,46 @@
+import numpy as np
+
+
+class GrowableArray:
+    """
+    Array que crece por el primer eje con capacidad amortizada (duplicación), de modo que
+    añadir k filas cuesta O(k) y no O(total) como np.concatenate.
+    """
+
+    def __init__(self, row_shape: tuple = (), dtype=np.float64, capacity: int = 1024):
+        """
+        Args:
+            row_shape (tuple): Forma de cada fila (p.ej. (3,) para estados x, y, z).
+            dtype: Tipo de dato.
+            capacity (int): Capacidad inicial en filas.
+        """
+        self._data = np.empty((max(1, capacity),) + tuple(row_shape), dtype=dtype)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, rows: np.ndarray) -> None:
+        """Añade un bloque de filas al final."""
+        rows = np.asarray(rows)
+        needed = self._size + len(rows)
+        if needed > len(self._data):
+            capacity = max(needed, 2 * len(self._data))
+            grown = np.empty((capacity,) + self._data.shape[1:], dtype=self._data.dtype)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+        self._data[self._size:needed] = rows
+        self._size = needed
+
+    def view(self, n: int = None) -> np.ndarray:
+        """
+        Vista de solo lectura de las primeras n filas (todas por defecto). Sigue siendo
+        válida tras nuevos append: las filas ya escritas nunca se modifican.
+        """
+        out = self._data[:self._size if n is None else min(n, self._size)]
+        out.flags.writeable = False
+        return out
+
+    def last(self) -> np.ndarray:
+        """Última fila."""
+        return self._data[self._size - 1].copy()
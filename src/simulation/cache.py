@@ -0,0 +1,255 @@
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import tempfile
+import time
+import numpy as np
+from typing import Callable
+from src.simulation.precision import Quantized
+
+# Se incluye en cada clave: incrementarlo invalida todo lo guardado con versiones anteriores
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "m3_dynamics")
+
+
+def _normalize(value):
+    """
+    Convierte los parámetros a una forma JSON canónica. Los arrays se representan por
+    un hash de su contenido (más forma y dtype), no por sus valores.
+    """
+    if isinstance(value, np.ndarray):
+        data = np.ascontiguousarray(value)
+        return {
+            "__ndarray__": hashlib.sha256(data.tobytes()).hexdigest(),
+            "shape": list(data.shape),
+            "dtype": data.dtype.str,
+        }
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.random.SeedSequence):
+        return {"__seedseq__": [value.entropy, list(value.spawn_key)]}
+    raise TypeError(f"Parámetro no serializable para la caché: {type(value).__name__}")
+
+
+def _is_reproducible(func: Callable, args: tuple, kwargs: dict) -> bool:
+    """
+    False si func acepta 'seed' y la llamada no fija una semilla entera (con el valor por
+    defecto incluido): su resultado cambia en cada llamada y no se puede cachear.
+    """
+    try:
+        bound = inspect.signature(func).bind(*args, **kwargs)
+    except (TypeError, ValueError):
+        # Firma no inspeccionable o llamada inválida: el propio método dará el error
+        return True
+    if "seed" not in bound.signature.parameters:
+        return True
+    bound.apply_defaults()
+    seed = bound.arguments["seed"]
+    return isinstance(seed, (int, np.integer)) and not isinstance(seed, bool)
+
+
+def make_key(namespace: str, params: dict) -> str:
+    """
+    Clave direccionada por contenido: sha256 del espacio de nombres y los parámetros.
+
+    Args:
+        namespace (str): Identificador del cálculo (p.ej. 'LorenzSystem.simulate').
+        params (dict): Parámetros del sistema, del solver y semilla.
+
+    Returns:
+        str: Digest hexadecimal.
+    """
+    payload = json.dumps(
+        {"version": CACHE_VERSION, "namespace": namespace, "params": params},
+        sort_keys=True, default=_normalize,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Caché en disco de resultados numéricos, compartida entre procesos y sesiones.
+    Cada entrada es un directorio con archivos .npy (leídos como memmap) y un meta.json.
+    Los resultados Quantized se guardan como sus enteros uint16; offset y escala van en meta.json.
+    Al superar max_bytes se expulsan las entradas usadas hace más tiempo (LRU por mtime).
+    """
+
+    def __init__(self, root: str = None, max_bytes: int = 2 * 1024**3):
+        """
+        Args:
+            root (str, optional): Directorio de la caché (por defecto $M3_CACHE_DIR o ~/.cache/m3_dynamics).
+            max_bytes (int): Tamaño máximo total en disco.
+        """
+        self.root = root or os.environ.get("M3_CACHE_DIR", DEFAULT_CACHE_DIR)
+        self.max_bytes = max_bytes
+        os.makedirs(self.root, exist_ok=True)
+
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key)
+
+    def get(self, key: str, mmap: bool = True):
+        """
+        Recupera una entrada (o None si no existe). Con mmap=True los arrays se abren
+        como memmap de solo lectura: la carga es casi instantánea aunque sean grandes.
+        """
+        entry = self._entry_dir(key)
+        meta_path = os.path.join(entry, "meta.json")
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            arrays = [
+                np.load(os.path.join(entry, f"arr_{i}.npy"), mmap_mode="r" if mmap else None)
+                for i in range(meta["n_arrays"])
+            ]
+        except (FileNotFoundError, json.JSONDecodeError):
+            # Entrada inexistente, o expulsada por otro proceso mientras la leíamos
+            return None
+        for i, quantization in meta.get("quantized", {}).items():
+            arrays[int(i)] = Quantized(arrays[int(i)], quantization["offset"], quantization["scale"])
+        arrays = tuple(arrays)
+
+        # Marcamos el acceso para la política LRU
+        try:
+            os.utime(meta_path)
+        except OSError:
+            pass
+
+        if "keys" in meta:
+            # Diccionario: los escalares (p.ej. una dimensión estimada) vuelven como números
+            return {key: value.item() if value.ndim == 0 else value for key, value in zip(meta["keys"], arrays)}
+        return arrays if meta["is_tuple"] else arrays[0]
+
+    def put(self, key: str, result, namespace: str = "", params: dict = None) -> None:
+        """
+        Guarda un array, una tupla de arrays (o de Quantized) o un diccionario de arrays y
+        escalares. La escritura es atómica: se escribe en un directorio temporal y se
+        renombra, así que los lectores nunca ven entradas a medias.
+        """
+        is_tuple = isinstance(result, tuple)
+        keys = [str(key) for key in result] if isinstance(result, dict) else None
+        arrays = tuple(result.values()) if keys is not None else result if is_tuple else (result,)
+
+        entry = self._entry_dir(key)
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        tmp = tempfile.mkdtemp(prefix=".tmp-", dir=os.path.dirname(entry))
+        try:
+            nbytes = 0
+            quantized = {}
+            for i, array in enumerate(arrays):
+                path = os.path.join(tmp, f"arr_{i}.npy")
+                if isinstance(array, Quantized):
+                    quantized[str(i)] = {"offset": array.offset.tolist(), "scale": array.scale.tolist()}
+                    array = array.data
+                np.save(path, np.asarray(array))
+                nbytes += os.path.getsize(path)
+
+            meta = {
+                "namespace": namespace,
+                "params": json.loads(json.dumps(params or {}, default=_normalize)),
+                "n_arrays": len(arrays),
+                "is_tuple": is_tuple,
+                **({"keys": keys} if keys is not None else {}),
+                "quantized": quantized,
+                "nbytes": nbytes,
+                "created": time.time(),
+            }
+            with open(os.path.join(tmp, "meta.json"), "w") as f:
+                json.dump(meta, f)
+
+            os.rename(tmp, entry)
+        except OSError:
+            # Otro proceso guardó la misma clave primero: su resultado es equivalente
+            shutil.rmtree(tmp, ignore_errors=True)
+            if not os.path.isdir(entry):
+                raise
+
+        self.evict()
+
+    def get_or_compute(self, namespace: str, params: dict, compute: Callable, mmap: bool = True):
+        """
+        Devuelve el resultado guardado para (namespace, params) o lo calcula y lo guarda.
+
+        Args:
+            namespace (str): Identificador del cálculo.
+            params (dict): Todo lo que determina el resultado (parámetros, solver, semilla).
+            compute (Callable): Función sin argumentos que produce el resultado.
+            mmap (bool): Abrir los arrays guardados como memmap de solo lectura.
+
+        Returns:
+            np.ndarray | tuple: El resultado (desde disco si ya existía).
+        """
+        key = make_key(namespace, params)
+        cached = self.get(key, mmap=mmap)
+        if cached is not None:
+            return cached
+
+        result = compute()
+        self.put(key, result, namespace, params)
+        return result
+
+    def call(self, target, method: str, *args, **kwargs):
+        """
+        Atajo para cachear un método de un sistema: la clave combina la clase, el estado
+        de la instancia (sigma, rho, r, vértices...) y los argumentos de la llamada.
+
+        Ejemplo:
+            cache.call(LorenzSystem(rho=28.0), 'simulate', 1.0, 1.0, 1.0, 30)
+            cache.call(LogisticMap, 'generate_bifurcation_data', 2.5, 4.0, 1000, 100, 800, seed=0)
+
+        El callback 'progress' se pasa al método pero no forma parte de la clave, como tampoco
+        los atributos privados ('_'): son estado de trabajo (p.ej. la última trayectoria que
+        LogisticMap reutiliza), no parámetros del resultado.
+
+        Si el método acepta 'seed' y la llamada no fija una semilla entera (None, un Generator...),
+        el resultado es aleatorio: se calcula sin pasar por la caché para no repetir siempre
+        la misma muestra.
+        """
+        cls = target if isinstance(target, type) else type(target)
+        if not _is_reproducible(getattr(target, method), args, kwargs):
+            return getattr(target, method)(*args, **kwargs)
+        state = {} if isinstance(target, type) else {
+            name: value for name, value in vars(target).items() if not name.startswith("_")
+        }
+        key_kwargs = {name: value for name, value in kwargs.items() if name != "progress"}
+        params = {"state": state, "args": list(args), "kwargs": key_kwargs}
+        return self.get_or_compute(f"{cls.__name__}.{method}", params,
+                                   lambda: getattr(target, method)(*args, **kwargs))
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        """Lista (último acceso, bytes, ruta) de todas las entradas completas."""
+        entries = []
+        for prefix in os.listdir(self.root):
+            prefix_dir = os.path.join(self.root, prefix)
+            if not os.path.isdir(prefix_dir):
+                continue
+            for name in os.listdir(prefix_dir):
+                meta_path = os.path.join(prefix_dir, name, "meta.json")
+                try:
+                    with open(meta_path) as f:
+                        nbytes = json.load(f)["nbytes"]
+                    entries.append((os.path.getmtime(meta_path), nbytes, os.path.join(prefix_dir, name)))
+                except (FileNotFoundError, NotADirectoryError, json.JSONDecodeError, KeyError):
+                    continue
+        return entries
+
+    def size(self) -> int:
+        """Tamaño total en bytes de las entradas guardadas."""
+        return sum(nbytes for _, nbytes, _ in self._entries())
+
+    def evict(self) -> None:
+        """Expulsa las entradas menos usadas recientemente hasta respetar max_bytes."""
+        entries = sorted(self._entries())
+        total = sum(nbytes for _, nbytes, _ in entries)
+        for _, nbytes, path in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= nbytes
+
+    def clear(self) -> None:
+        """Elimina todas las entradas."""
+        for _, _, path in self._entries():
+            shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,251 @@
+import numpy as np
+from typing import Iterable
+
+
+def _fit_slope(x: np.ndarray, y: np.ndarray) -> float:
+    """Pendiente por mínimos cuadrados de y frente a x (ignorando valores no finitos)."""
+    valid = np.isfinite(x) & np.isfinite(y)
+    if np.count_nonzero(valid) < 2:
+        return float("nan")
+    return float(np.polyfit(x[valid], y[valid], 1)[0])
+
+
+def _morton_encode(cells: np.ndarray, bits: int) -> np.ndarray:
+    """
+    Intercala los bits de las coordenadas enteras de celda (n, d) en un código Morton
+    uint64. Desplazar el código d bits a la derecha da la celda padre en el nivel más
+    grueso, así que un solo código por punto sirve para toda la jerarquía.
+    """
+    n, dim = cells.shape
+    codes = np.zeros(n, dtype=np.uint64)
+    for bit in range(bits):
+        for axis in range(dim):
+            codes |= ((cells[:, axis] >> np.uint64(bit)) & np.uint64(1)) << np.uint64(bit * dim + axis)
+    return codes
+
+
+class BoxCounter:
+    """
+    Conteo de cajas por streaming. Cada bloque de puntos se convierte en códigos Morton
+    del nivel más fino y solo se conservan los códigos ocupados (únicos); los niveles
+    gruesos se obtienen después desplazando bits. Una sola pasada por los datos y memoria
+    O(cajas ocupadas en el nivel más fino), sin importar cuántos puntos se procesen.
+    """
+
+    def __init__(self, bounds: tuple, max_level: int = 10):
+        """
+        Args:
+            bounds (tuple): Ventana (x_min, x_max, y_min, y_max[, z_min, z_max]). Se usa un
+                            hipercubo con la arista mayor para que las cajas sean cubos.
+            max_level (int): Nivel más fino: 2**max_level cajas por eje.
+        """
+        low = np.asarray(bounds[0::2], dtype=float)
+        high = np.asarray(bounds[1::2], dtype=float)
+        self.dim = len(low)
+        if max_level * self.dim > 63:
+            raise ValueError(f"max_level={max_level} excede los 64 bits del código en {self.dim} dimensiones")
+        self.max_level = max_level
+        self.origin = low
+        self.edge = float(np.max(high - low)) * (1.0 + 1e-9)
+        self.n_points = 0
+        self.n_outside = 0
+        self._codes = np.empty(0, dtype=np.uint64)
+
+    def add(self, points: np.ndarray) -> None:
+        """Registra un bloque de puntos (n, d); los que caen fuera de la ventana se descartan."""
+        points = np.asarray(points, dtype=float).reshape(-1, self.dim)
+        side = 1 << self.max_level
+        cells = np.floor((points - self.origin) * (side / self.edge))
+        inside = np.all((cells >= 0) & (cells < side), axis=1)
+        self.n_points += len(points)
+        self.n_outside += len(points) - int(np.count_nonzero(inside))
+
+        codes = np.unique(_morton_encode(cells[inside].astype(np.uint64), self.max_level))
+        self._codes = np.union1d(self._codes, codes)
+
+    def counts(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Cajas ocupadas por nivel.
+
+        Returns:
+            tuple: (epsilon, N(epsilon)) para los niveles 0..max_level, con epsilon el lado
+                   de caja relativo a la ventana (1, 1/2, 1/4, ...).
+        """
+        levels = np.arange(self.max_level + 1)
+        counts = np.empty(len(levels), dtype=np.int64)
+        for level in levels:
+            shift = np.uint64(self.dim * (self.max_level - level))
+            coarse = self._codes >> shift
+            # Los códigos están ordenados, así que basta contar los cambios
+            counts[level] = 0 if coarse.size == 0 else 1 + np.count_nonzero(np.diff(coarse))
+        return 0.5 ** levels, counts
+
+    def dimension(self, min_level: int = 2, max_level: int = None) -> float:
+        """
+        Dimensión de conteo de cajas: pendiente de log N(eps) frente a log(1/eps) en los
+        niveles [min_level, max_level]. Los niveles más finos se saturan cuando hay pocos
+        puntos por caja; conviene descartarlos si N(eps) se acerca al número de puntos.
+        """
+        epsilon, counts = self.counts()
+        levels = slice(min_level, (self.max_level if max_level is None else max_level) + 1)
+        with np.errstate(divide="ignore"):
+            return _fit_slope(-np.log(epsilon[levels]), np.log(counts[levels].astype(float)))
+
+
+class CorrelationSum:
+    """
+    Suma de correlación de Grassberger–Procaccia por streaming. En lugar de las O(n^2)
+    distancias por pares, cada bloque se compara contra una muestra de referencia
+    (reservorio uniforme de los puntos anteriores) usando un conteo dual de árboles k-d:
+    C(r) se estima como la fracción de pares (referencia, punto) a distancia <= r.
+    """
+
+    def __init__(self, radii: np.ndarray, n_reference: int = 1000, theiler: int = 0, seed=None):
+        """
+        Args:
+            radii (np.ndarray): Radios r (crecientes) donde se evalúa C(r).
+            n_reference (int): Tamaño del reservorio de referencia.
+            theiler (int): Ventana de Theiler: se excluyen los pares separados por menos de
+                           'theiler' instantes (evita contar vecinos temporales de una trayectoria).
+            seed (int | np.random.Generator, optional): Semilla del muestreo.
+        """
+        self.radii = np.asarray(radii, dtype=float)
+        self.n_reference = n_reference
+        self.theiler = theiler
+        self.rng = np.random.default_rng(seed)
+        self.pair_counts = np.zeros(len(self.radii), dtype=np.float64)
+        self.n_pairs = 0.0
+        self.n_seen = 0
+        self._reference = None
+        self._reference_times = None
+        self._filled = 0
+
+    def add(self, points: np.ndarray, times: np.ndarray = None) -> None:
+        """
+        Registra un bloque de puntos (n, d).
+
+        Args:
+            points (np.ndarray): Puntos del bloque.
+            times (np.ndarray, optional): Instante entero de cada punto para la ventana de
+                                          Theiler (por defecto, su posición en el stream).
+        """
+        from scipy.spatial import cKDTree
+
+        points = np.asarray(points, dtype=float)
+        points = points.reshape(len(points), -1)
+        n = len(points)
+        if n == 0:
+            return
+        if times is None:
+            times = self.n_seen + np.arange(n)
+        times = np.asarray(times)
+
+        if self._reference is None:
+            self._reference = np.empty((self.n_reference, points.shape[1]))
+            self._reference_times = np.empty(self.n_reference, dtype=np.int64)
+        if self._filled == 0 and n > 1:
+            # Sin referencias todavía: la primera mitad del bloque llena el reservorio y la
+            # segunda se compara contra ella (así un único bloque también da resultado)
+            half = n // 2
+            self.add(points[:half], times[:half])
+            self.add(points[half:], times[half:])
+            return
+
+        # Pares contra las referencias ya tomadas de bloques anteriores, salvo las que
+        # quedan dentro de la ventana de Theiler del inicio de este bloque
+        reference = self._reference[:self._filled]
+        usable = self._reference_times[:self._filled] < times.min() - self.theiler
+        if np.any(usable):
+            ref_tree = cKDTree(reference[usable])
+            # El árbol del bloque se usa una sola vez: sin balancear se construye ~2x más rápido
+            block_tree = cKDTree(points, balanced_tree=False, compact_nodes=False)
+            self.pair_counts += ref_tree.count_neighbors(block_tree, self.radii)
+            self.n_pairs += float(np.count_nonzero(usable)) * n
+
+        self._update_reservoir(points, times)
+        self.n_seen += n
+
+    def _update_reservoir(self, points: np.ndarray, times: np.ndarray) -> None:
+        """Algoritmo R vectorizado: tras el bloque, el reservorio es una muestra uniforme del stream."""
+        n = len(points)
+        take = min(self.n_reference - self._filled, n)
+        self._reference[self._filled:self._filled + take] = points[:take]
+        self._reference_times[self._filled:self._filled + take] = times[:take]
+        self._filled += take
+        if take == n:
+            return
+
+        # El punto con índice global t reemplaza una entrada al azar con probabilidad k / (t + 1);
+        # con índices repetidos gana el último, como en el algoritmo secuencial
+        index = self.n_seen + np.arange(take, n)
+        accept = self.rng.random(n - take) < self.n_reference / (index + 1.0)
+        slots = self.rng.integers(0, self.n_reference, size=int(np.count_nonzero(accept)))
+        chosen = np.flatnonzero(accept) + take
+        self._reference[slots] = points[chosen]
+        self._reference_times[slots] = times[chosen]
+
+    def correlation(self) -> np.ndarray:
+        """Estimación de C(r) en cada radio."""
+        if self.n_pairs == 0:
+            return np.full(len(self.radii), np.nan)
+        return self.pair_counts / self.n_pairs
+
+    def dimension(self, r_min: float = None, r_max: float = None) -> float:
+        """
+        Dimensión de correlación: pendiente de log C(r) frente a log r en [r_min, r_max]
+        (por defecto, todos los radios con C(r) > 0).
+        """
+        correlation = self.correlation()
+        mask = correlation > 0
+        if r_min is not None:
+            mask &= self.radii >= r_min
+        if r_max is not None:
+            mask &= self.radii <= r_max
+        return _fit_slope(np.log(self.radii[mask]), np.log(correlation[mask]))
+
+
+def estimate_dimensions(chunks: Iterable[np.ndarray], bounds: tuple, max_level: int = 10,
+                        box_levels: tuple = (2, None), radii: np.ndarray = None, n_reference: int = 1000,
+                        theiler: int = 0, seed=None) -> dict:
+    """
+    Conteo de cajas y dimensión de correlación en una sola pasada sobre bloques de puntos.
+
+    Args:
+        chunks (Iterable): Bloques (n, d) de puntos, o tuplas (puntos, instantes) para la
+                           ventana de Theiler.
+        bounds (tuple): Ventana (x_min, x_max, y_min, y_max[, z_min, z_max]) que contiene los puntos.
+        max_level (int): Nivel más fino del conteo de cajas (2**max_level cajas por eje).
+        box_levels (tuple): Niveles (mínimo, máximo) del ajuste de la dimensión de cajas.
+        radii (np.ndarray, optional): Radios de C(r). Por defecto, 16 radios logarítmicos
+                                      entre 1/512 y 1/16 de la arista de la ventana (el coste
+                                      crece con el número de pares dentro del radio mayor).
+        n_reference (int): Tamaño de la muestra de referencia de C(r).
+        theiler (int): Ventana de Theiler en instantes.
+        seed (int, optional): Semilla del muestreo de referencias.
+
+    Returns:
+        dict: 'box_dimension', 'epsilon', 'box_counts', 'correlation_dimension', 'radii',
+              'correlation', 'n_points' y 'n_outside' (puntos fuera de la ventana, que el
+              conteo de cajas descartó).
+    """
+    boxes = BoxCounter(bounds, max_level)
+    if radii is None:
+        radii = boxes.edge * np.geomspace(1 / 512, 1 / 16, 16)
+    correlation = CorrelationSum(radii, n_reference, theiler, seed)
+
+    for chunk in chunks:
+        points, times = chunk if isinstance(chunk, tuple) else (chunk, None)
+        boxes.add(points)
+        correlation.add(points, times)
+
+    epsilon, counts = boxes.counts()
+    return {
+        "box_dimension": boxes.dimension(*box_levels),
+        "epsilon": epsilon * boxes.edge,
+        "box_counts": counts,
+        "correlation_dimension": correlation.dimension(),
+        "radii": correlation.radii,
+        "correlation": correlation.correlation(),
+        "n_points": boxes.n_points,
+        "n_outside": boxes.n_outside,
+    }
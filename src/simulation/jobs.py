@@ -0,0 +1,143 @@
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+
+class JobCancelled(Exception):
+    """Se lanza dentro de un trabajo cuando su resultado ya no interesa."""
+
+
+class Job:
+    """
+    Trabajo en segundo plano con progreso y cancelación cooperativa. La función recibe
+    job.report como callback 'progress': cada llamada publica la fracción completada y,
+    si el trabajo fue cancelado, lanza JobCancelled para que la función termine pronto.
+    """
+
+    def __init__(self, key):
+        """
+        Args:
+            key: Identificador de los parámetros del trabajo (hashable y comparable).
+        """
+        self.key = key
+        self.progress = 0.0
+        self.future: Future = None
+        self._cancelled = threading.Event()
+
+    def report(self, fraction: float) -> None:
+        """Callback de progreso (0..1); interrumpe el trabajo si fue cancelado."""
+        if self._cancelled.is_set():
+            raise JobCancelled()
+        self.progress = min(1.0, max(self.progress, float(fraction)))
+
+    def cancel(self) -> None:
+        """Cancela el trabajo: si no empezó no se ejecuta; si está corriendo, se detiene en el próximo report()."""
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def done(self) -> bool:
+        return self.future is not None and self.future.done()
+
+    def failed(self) -> bool:
+        """True si el trabajo terminó con una excepción distinta de la cancelación."""
+        if not self.done() or self.future.cancelled():
+            return False
+        error = self.future.exception()
+        return error is not None and not isinstance(error, JobCancelled)
+
+    def result(self, timeout: float = None):
+        """Resultado del trabajo (bloquea hasta timeout segundos si no terminó)."""
+        return self.future.result(timeout)
+
+
+class JobManager:
+    """
+    Un trabajo activo por 'slot' (p.ej. una pestaña del dashboard). Pedir un slot con una
+    clave distinta cancela el trabajo anterior, así que mover un slider rápidamente no
+    encola simulaciones redundantes: solo la última clave llega a ejecutarse completa.
+    Los trabajos de un mismo slot nunca corren a la vez (pueden compartir estado, como
+    una simulación reanudable): el nuevo espera a que el cancelado se detenga.
+    Un trabajo que terminó con error se descarta en el siguiente submit y se reintenta.
+    """
+
+    def __init__(self, max_workers: int = 2, executor: ThreadPoolExecutor = None):
+        """
+        Args:
+            max_workers (int): Hilos del executor propio (NumPy y SciPy liberan el GIL en los bucles pesados).
+            executor (ThreadPoolExecutor, optional): Executor compartido (p.ej. entre las sesiones
+                                                     del dashboard). No se cierra en shutdown().
+        """
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="m3-job")
+        self._jobs = {}
+        self._slot_locks = {}
+        self._lock = threading.Lock()
+
+    def submit(self, slot: str, key, fn: Callable, *args, **kwargs) -> Job:
+        """
+        Devuelve el trabajo del slot para 'key', lanzándolo si hace falta. La función se
+        llama como fn(*args, progress=job.report, **kwargs) dentro de una copia del contexto
+        de quien la lanza (p.ej. el perfilador activo de la sesión).
+
+        Args:
+            slot (str): Nombre del slot (un trabajo vivo por slot).
+            key: Parámetros del trabajo; si coinciden con los del trabajo actual se reutiliza.
+            fn (Callable): Cálculo a ejecutar en segundo plano.
+
+        Returns:
+            Job: Trabajo (nuevo o existente) asociado a la clave.
+        """
+        with self._lock:
+            current = self._jobs.get(slot)
+            if current is not None and current.key == key and not current.cancelled and not current.failed():
+                return current
+            if current is not None:
+                current.cancel()
+
+            job = Job(key)
+            slot_lock = self._slot_locks.setdefault(slot, threading.Lock())
+            context = contextvars.copy_context()
+            job.future = self._executor.submit(context.run, self._run, slot_lock, job, fn, args, kwargs)
+            self._jobs[slot] = job
+            return job
+
+    @staticmethod
+    def _run(slot_lock: threading.Lock, job: Job, fn: Callable, args: tuple, kwargs: dict):
+        with slot_lock:
+            if job.cancelled:
+                raise JobCancelled()
+            return fn(*args, progress=job.report, **kwargs)
+
+    def get(self, slot: str) -> Job:
+        """Trabajo actual del slot (o None)."""
+        return self._jobs.get(slot)
+
+    def cancel(self, slot: str = None) -> None:
+        """Cancela el trabajo de un slot, o de todos si slot es None."""
+        with self._lock:
+            slots = list(self._jobs) if slot is None else [slot]
+            for name in slots:
+                job = self._jobs.pop(name, None)
+                if job is not None:
+                    job.cancel()
+
+    def cancel_all_except(self, prefix: str) -> None:
+        """
+        Cancela los trabajos de todos los slots salvo 'prefix' y los que empiezan por
+        'prefix:' (p.ej. "fractal" conserva "fractal" y "fractal:dimension").
+        """
+        for name in list(self._jobs):
+            if name != prefix and not name.startswith(prefix + ":"):
+                self.cancel(name)
+
+    def shutdown(self) -> None:
+        """Cancela todo y libera los hilos (salvo si el executor es compartido)."""
+        self.cancel()
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,70 @@
+import numpy as np
+from typing import Callable
+from src.simulation.solvers import BatchRHS, rk4_step, _column_args
+
+# Firma del jacobiano por lotes: jacobian(states, *args) -> (N, d, d)
+BatchJacobian = Callable[..., np.ndarray]
+
+
+def _tangent_rk4_step(rhs: BatchRHS, jacobian: BatchJacobian, y: np.ndarray, basis: np.ndarray,
+                      h: float, args: tuple) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Paso RK4 del sistema aumentado: estado y' = f(y) y base tangente Q' = J(y) Q.
+    """
+    def augmented(ys, qs):
+        return rhs(ys, *args), jacobian(ys, *args) @ qs
+
+    k1y, k1q = augmented(y, basis)
+    k2y, k2q = augmented(y + 0.5 * h * k1y, basis + 0.5 * h * k1q)
+    k3y, k3q = augmented(y + 0.5 * h * k2y, basis + 0.5 * h * k2q)
+    k4y, k4q = augmented(y + h * k3y, basis + h * k3q)
+
+    y_new = y + (h / 6.0) * (k1y + 2.0 * k2y + 2.0 * k3y + k4y)
+    basis_new = basis + (h / 6.0) * (k1q + 2.0 * k2q + 2.0 * k3q + k4q)
+    return y_new, basis_new
+
+
+def benettin_spectrum(rhs: BatchRHS, jacobian: BatchJacobian, y0: np.ndarray, dt: float, n_steps: int,
+                      args: tuple = (), transient_steps: int = 0, renorm_every: int = 10,
+                      observer: Callable = None) -> np.ndarray:
+    """
+    Espectro de Lyapunov por el método de Benettin (reortonormalización QR) para un
+    ensamble completo en una sola pasada: estados (N, d) y bases tangentes (N, d, d).
+
+    Args:
+        rhs (BatchRHS): Función de derivadas por lotes.
+        jacobian (BatchJacobian): Jacobiano por lotes del campo vectorial.
+        y0 (np.ndarray): Estados iniciales de forma (N, d).
+        dt (float): Paso de integración (RK4).
+        n_steps (int): Pasos usados para promediar los exponentes.
+        args (tuple): Parámetros adicionales (escalares o arrays (N,), uno por miembro).
+        transient_steps (int): Pasos previos para llegar al atractor (no se promedian).
+        renorm_every (int): Cada cuántos pasos se reortonormaliza la base tangente.
+        observer (Callable, optional): observer(y) se llama con los estados (N, d) tras cada
+                                       paso promediado (p.ej. para acumular estadísticas).
+
+    Returns:
+        np.ndarray: Exponentes de forma (N, d), ordenados de mayor a menor.
+    """
+    y = np.array(y0, dtype=float, ndmin=2)
+    args = _column_args(args)
+    n_members, dim = y.shape
+
+    for _ in range(transient_steps):
+        y = rk4_step(rhs, y, dt, args)
+
+    basis = np.broadcast_to(np.eye(dim), (n_members, dim, dim)).copy()
+    log_growth = np.zeros((n_members, dim))
+
+    for k in range(1, n_steps + 1):
+        y, basis = _tangent_rk4_step(rhs, jacobian, y, basis, dt, args)
+        if observer is not None:
+            observer(y)
+
+        if k % renorm_every == 0 or k == n_steps:
+            # QR por lotes: R guarda el estiramiento de cada dirección desde la última renormalización
+            basis, r = np.linalg.qr(basis)
+            log_growth += np.log(np.abs(np.diagonal(r, axis1=1, axis2=2)))
+
+    exponents = log_growth / (n_steps * dt)
+    return -np.sort(-exponents, axis=1)
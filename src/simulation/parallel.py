@@ -0,0 +1,212 @@
+import json
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Callable
+
+
+def chunk_bounds(n_items: int, chunk_size: int) -> list[tuple[int, int]]:
+    """
+    Divide el rango [0, n_items) en bloques contiguos de tamaño fijo.
+    El particionado depende solo de chunk_size (no del número de procesos),
+    lo que garantiza resultados idénticos para cualquier cantidad de workers.
+
+    Args:
+        n_items (int): Longitud total del rango.
+        chunk_size (int): Tamaño máximo de cada bloque.
+
+    Returns:
+        list: Lista de pares (inicio, fin).
+    """
+    chunk_size = max(1, int(chunk_size))
+    return [(lo, min(lo + chunk_size, n_items)) for lo in range(0, n_items, chunk_size)]
+
+
+def chunk_seeds(seed, n_chunks: int) -> list[np.random.SeedSequence]:
+    """
+    Genera una SeedSequence independiente por bloque a partir de una semilla raíz.
+
+    Args:
+        seed (int | np.random.SeedSequence | None): Semilla raíz (None = entropía del sistema).
+        n_chunks (int): Número de bloques.
+
+    Returns:
+        list: Secuencias hijas, una por bloque, estadísticamente independientes.
+    """
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    return root.spawn(n_chunks)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Se conecta a un bloque de memoria compartida existente desde un worker.
+    El proceso padre es el único dueño del bloque (solo él lo destruye con unlink).
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 no acepta track=False. Los workers del pool comparten el
+        # resource_tracker del padre, así que el registro duplicado es inofensivo
+        return shared_memory.SharedMemory(name=name)
+
+
+def _open_outputs(layout: dict) -> tuple[dict, list]:
+    """
+    Reconstruye las vistas de salida a partir del layout: bloques de memoria compartida
+    ('shm') o archivos .npy de checkpoint abiertos como memmap ('file').
+    """
+    outputs, handles = {}, []
+    for key, (kind, ref, shape, dtype) in layout.items():
+        if kind == "shm":
+            shm = _attach(ref)
+            handles.append(shm)
+            outputs[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        else:
+            outputs[key] = np.load(ref, mmap_mode="r+")
+    return outputs, handles
+
+
+def _run_task(kernel: Callable, layout: dict, task: tuple) -> None:
+    """
+    Punto de entrada en el worker: reconstruye las vistas sobre la memoria compartida
+    y ejecuta el kernel, que escribe su resultado in-place (nada grande vuelve al padre).
+    """
+    outputs, handles = _open_outputs(layout)
+    try:
+        kernel(outputs, *task)
+        for array in outputs.values():
+            if isinstance(array, np.memmap):
+                array.flush()
+        del outputs
+    finally:
+        for shm in handles:
+            shm.close()
+
+
+def _open_checkpoint(checkpoint: str, outputs: dict, n_tasks: int, signature: dict) -> tuple[dict, np.ndarray]:
+    """
+    Abre (o crea) el directorio de checkpoint: un .npy por salida más 'done.npy' con el
+    estado de cada tarea. Si ya existe, verifica que corresponda al mismo cálculo.
+    """
+    os.makedirs(checkpoint, exist_ok=True)
+    manifest_path = os.path.join(checkpoint, "manifest.json")
+    manifest = {
+        "n_tasks": n_tasks,
+        "outputs": {key: [list(shape), np.dtype(dtype).str] for key, (shape, dtype) in outputs.items()},
+        "signature": signature,
+    }
+    manifest = json.loads(json.dumps(manifest))
+
+    paths = {key: os.path.join(checkpoint, f"{key}.npy") for key in outputs}
+    done_path = os.path.join(checkpoint, "done.npy")
+
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            if json.load(f) != manifest:
+                raise ValueError(f"El checkpoint {checkpoint} pertenece a otro cálculo")
+    else:
+        for key, (shape, dtype) in outputs.items():
+            np.lib.format.open_memmap(paths[key], mode="w+", dtype=dtype, shape=shape).flush()
+        np.save(done_path, np.zeros(n_tasks, dtype=bool))
+        # El manifiesto se escribe al final: su presencia indica un checkpoint inicializado
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f)
+
+    return paths, np.load(done_path, mmap_mode="r+")
+
+
+def run_chunked(kernel: Callable, outputs: dict, tasks: list[tuple], n_workers: int = 1,
+                checkpoint: str = None, signature: dict = None, progress: Callable = None) -> dict:
+    """
+    Ejecuta una lista de tareas por bloques que escriben en buffers de salida comunes.
+    Con n_workers > 1 los buffers viven en memoria compartida y las tareas corren en
+    un pool de procesos; con n_workers = 1 todo corre en el proceso actual.
+
+    Con checkpoint, los buffers son archivos .npy mapeados en memoria (compartidos por
+    todos los procesos) y cada tarea terminada queda marcada en disco: si la ejecución
+    se interrumpe, volver a llamar con el mismo checkpoint solo ejecuta lo pendiente.
+
+    Args:
+        kernel (Callable): Función de módulo kernel(outputs, *task) que escribe su región
+                           de los arrays de salida. Debe ser importable (picklable).
+        outputs (dict): Mapa nombre -> (shape, dtype) de los arrays de salida.
+        tasks (list): Argumentos de cada tarea.
+        n_workers (int): Número de procesos.
+        checkpoint (str, optional): Directorio donde persistir resultados y progreso.
+        signature (dict, optional): Descripción del cálculo (parámetros) que debe coincidir
+                                    al reanudar un checkpoint existente.
+        progress (Callable, optional): progress(fracción) tras cada tarea terminada. Si lanza
+                                       una excepción, las tareas pendientes se cancelan.
+
+    Returns:
+        dict: Mapa nombre -> np.ndarray con los resultados completos.
+    """
+    report = progress or (lambda fraction: None)
+
+    if checkpoint is not None:
+        paths, done = _open_checkpoint(checkpoint, outputs, len(tasks), signature or {})
+        layout = {key: ("file", paths[key], shape, np.dtype(dtype).str) for key, (shape, dtype) in outputs.items()}
+        pending = [i for i in range(len(tasks)) if not done[i]]
+        n_done = len(tasks) - len(pending)
+
+        if n_workers <= 1 or len(pending) <= 1:
+            for i in pending:
+                _run_task(kernel, layout, tasks[i])
+                done[i] = True
+                done.flush()
+                n_done += 1
+                report(n_done / len(tasks))
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                futures = {pool.submit(_run_task, kernel, layout, tasks[i]): i for i in pending}
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                        done[futures[future]] = True
+                        done.flush()
+                        n_done += 1
+                        report(n_done / len(tasks))
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+        return {key: np.array(np.load(paths[key], mmap_mode="r")) for key in outputs}
+
+    if n_workers <= 1 or len(tasks) <= 1:
+        arrays = {key: np.zeros(shape, dtype=dtype) for key, (shape, dtype) in outputs.items()}
+        for i, task in enumerate(tasks):
+            kernel(arrays, *task)
+            report((i + 1) / len(tasks))
+        return arrays
+
+    blocks = {}
+    try:
+        layout = {}
+        for key, (shape, dtype) in outputs.items():
+            nbytes = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+            blocks[key] = shared_memory.SharedMemory(create=True, size=nbytes)
+            np.ndarray(shape, dtype=dtype, buffer=blocks[key].buf).fill(0)
+            layout[key] = ("shm", blocks[key].name, shape, np.dtype(dtype).str)
+
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            futures = [pool.submit(_run_task, kernel, layout, task) for task in tasks]
+            try:
+                for i, future in enumerate(as_completed(futures)):
+                    future.result()
+                    report((i + 1) / len(tasks))
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        # Copiamos fuera de la memoria compartida para poder liberarla
+        return {
+            key: np.ndarray(shape, dtype=dtype, buffer=blocks[key].buf).copy()
+            for key, (shape, dtype) in outputs.items()
+        }
+    finally:
+        for shm in blocks.values():
+            shm.close()
+            shm.unlink()
@@ -0,0 +1,184 @@
+import numpy as np
+
+# Política de tipos de las salidas de los generadores (parámetro output_dtype):
+#   "float64"  Referencia: sin pérdida.
+#   "float32"  Mitad de memoria, caché y transferencia. Los sistemas caóticos (logístico,
+#              Lorenz) se siguen integrando en float64 y solo se redondea al guardar: error
+#              relativo <= 6e-8 por valor. El juego del caos sí calcula en float32, porque
+#              sus mapas son contractivos y el error de redondeo no crece.
+#   "uint16"   Un cuarto de la memoria, solo para graficar o binnear: cada valor se guarda
+#              como entero 0..65535 con valor = offset + data * scale. Error absoluto
+#              ≈ scale / 2 = rango / 131070 por eje (p.ej. 7.6e-6 en x del mapa logístico).
+# El error medido frente a float64 para cada generador se obtiene con
+#   python -m benchmarks.precision
+OUTPUT_DTYPES = ("float64", "float32", "uint16")
+
+_LEVELS = np.iinfo(np.uint16).max
+# Elementos por bloque al codificar: los temporales float64 no escalan con el resultado
+_ENCODE_BLOCK = 1 << 18
+
+
+def check_output_dtype(output_dtype) -> str:
+    """
+    Normaliza la política de tipos ("float32", np.float32, np.dtype('uint16')...) a su nombre.
+    """
+    name = np.dtype(output_dtype).name if not isinstance(output_dtype, str) else output_dtype
+    if name not in OUTPUT_DTYPES:
+        raise ValueError(f"output_dtype desconocido {output_dtype!r}. Use uno de {OUTPUT_DTYPES}")
+    return name
+
+
+def buffer_dtype(output_dtype) -> type:
+    """Tipo flotante de los buffers intermedios: float32 basta antes de cuantizar a uint16."""
+    return np.float64 if check_output_dtype(output_dtype) == "float64" else np.float32
+
+
+class Quantized:
+    """
+    Coordenadas cuantizadas a uint16 con metadatos de escala: valor ≈ offset + data * scale.
+    offset y scale son escalares o arrays que se combinan por broadcasting con data
+    (p.ej. forma (3,) para una escala por eje de una trayectoria (n, 3)).
+    np.asarray(q) devuelve los valores decodificados en float64.
+    """
+
+    def __init__(self, data: np.ndarray, offset, scale):
+        """
+        Args:
+            data (np.ndarray): Enteros uint16 (puede ser un memmap de solo lectura).
+            offset (float | np.ndarray): Valor representado por el entero 0.
+            scale (float | np.ndarray): Paso entre enteros consecutivos.
+        """
+        self.data = data
+        self.offset = np.asarray(offset, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+
+    @property
+    def shape(self) -> tuple:
+        return self.data.shape
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+
+    @property
+    def max_error(self) -> np.ndarray:
+        """Error absoluto máximo de redondeo (medio paso) dentro del rango cuantizado."""
+        return self.scale / 2
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index) -> "Quantized":
+        """
+        Corta filas (q[10:20], q[mask]) o filas y columnas (q[:, 0], q[::2, :2]): al
+        seleccionar columnas, offset y scale por eje se cortan igual. Los índices que mezclan
+        la columna con otros ejes de forma ambigua (Ellipsis, None, máscaras de varios ejes,
+        arrays en la columna y en otro eje) lanzan IndexError: decodifique antes con np.asarray(q).
+        """
+        data = self.data[index]
+        if self.offset.ndim == 0 and self.scale.ndim == 0:
+            return Quantized(data, self.offset, self.scale)
+
+        key = index if isinstance(index, tuple) else (index,)
+        if any(k is Ellipsis or k is None for k in key):
+            raise IndexError("Quantized no admite Ellipsis ni None en el índice")
+        spans = [np.ndim(k) if np.asarray(k).dtype == bool else 1 for k in key]
+        if sum(spans) < self.data.ndim:
+            # Solo filas: las columnas conservan su escala
+            return Quantized(data, self.offset, self.scale)
+
+        column, rest = key[-1], key[:-1]
+        column_is_array = np.ndim(column) > 0
+        if spans[-1] != 1 or (column_is_array and not all(isinstance(k, slice) for k in rest)):
+            raise IndexError("Índice de columnas no soportado en Quantized: use filas y una columna "
+                             "(entero, slice o lista), p.ej. q[:, 0]")
+        per_axis = self.data.shape[-1:]
+        return Quantized(data, np.broadcast_to(self.offset, per_axis)[column],
+                         np.broadcast_to(self.scale, per_axis)[column])
+
+    def dequantize(self, dtype=np.float64) -> np.ndarray:
+        """Valores decodificados offset + data * scale."""
+        # np.asarray: con un solo elemento (q[i, j]) la operación devuelve un escalar
+        return np.asarray(self.offset + self.data * self.scale).astype(dtype, copy=False)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return self.dequantize(np.float64 if dtype is None else dtype)
+
+    def __repr__(self) -> str:
+        return f"Quantized(shape={self.shape}, offset={self.offset.tolist()}, scale={self.scale.tolist()})"
+
+
+def quantization_scale(low, high) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (offset, scale) que reparten [low, high] en 65536 niveles. Un rango vacío usa scale = 1
+    para que todos los valores se codifiquen como 0 sin dividir por cero.
+    """
+    low = np.asarray(low, dtype=np.float64)
+    span = np.asarray(high, dtype=np.float64) - low
+    return low, np.where(span > 0, span / _LEVELS, 1.0)
+
+
+def encode(values: np.ndarray, offset, scale, out: np.ndarray = None) -> np.ndarray:
+    """
+    Codifica values a uint16 con (offset, scale) fijos; los valores fuera del rango se recortan
+    a sus extremos. Escribe en out si se indica (útil para volcar bloques en un buffer).
+    Se procesa por bloques de filas, así que la memoria extra es O(_ENCODE_BLOCK).
+    """
+    values = np.asarray(values)
+    if out is None:
+        out = np.empty(values.shape, dtype=np.uint16)
+    if values.ndim == 0:
+        values, target = values.reshape(1), out.reshape(1)
+    else:
+        target = out
+    rows = max(1, _ENCODE_BLOCK // max(1, values[:1].size))
+    for start in range(0, len(values), rows):
+        levels = np.subtract(values[start:start + rows], offset, dtype=np.float64)
+        levels /= scale
+        if not np.isfinite(levels).all():
+            raise ValueError("No se pueden cuantizar valores no finitos (¿trayectoria divergente?)")
+        np.rint(levels, out=levels)
+        np.clip(levels, 0, _LEVELS, out=levels)
+        target[start:start + rows] = levels
+    return out
+
+
+def quantize(values: np.ndarray, low=None, high=None) -> Quantized:
+    """
+    Cuantiza values a uint16.
+
+    Args:
+        values (np.ndarray): Valores finitos.
+        low, high (float | np.ndarray, optional): Rango representado (escalar o por columna).
+                                                  Por defecto, el mínimo y el máximo globales.
+
+    Returns:
+        Quantized: Enteros con su offset y escala.
+    """
+    values = np.asarray(values)
+    if low is None:
+        low = values.min() if values.size else 0.0
+    if high is None:
+        high = values.max() if values.size else 0.0
+    offset, scale = quantization_scale(low, high)
+    return Quantized(encode(values, offset, scale), offset, scale)
+
+
+def as_output(values: np.ndarray, output_dtype, low=None, high=None):
+    """
+    Aplica la política de tipos a un resultado calculado.
+
+    Args:
+        values (np.ndarray): Resultado (float64 o float32).
+        output_dtype (str): "float64", "float32" o "uint16".
+        low, high (float | np.ndarray, optional): Rango de la cuantización (ver quantize).
+
+    Returns:
+        np.ndarray | Quantized: values sin cambios, convertido a float32 o cuantizado.
+    """
+    output_dtype = check_output_dtype(output_dtype)
+    if output_dtype == "uint16":
+        return quantize(values, low, high)
+    if output_dtype == "float32":
+        return np.asarray(values).astype(np.float32, copy=False)
+    return values
@@ -0,0 +1,185 @@
+import contextvars
+import functools
+import json
+import threading
+import time
+from collections import deque
+from typing import Callable
+import numpy as np
+
+
+def _nbytes(result) -> int:
+    """Bytes de los arrays contenidos en un resultado (array, tupla/lista o diccionario)."""
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    if isinstance(result, (tuple, list)):
+        return sum(_nbytes(item) for item in result)
+    if isinstance(result, dict):
+        return sum(_nbytes(item) for item in result.values())
+    return 0
+
+
+class _Stage:
+    """Contexto activo de una etapa medida; annotate() registra el tamaño de sus datos."""
+
+    __slots__ = ("profiler", "name", "start", "nbytes")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.nbytes = 0
+
+    def annotate(self, data) -> None:
+        """Suma el tamaño en bytes de los arrays de 'data' a la etapa."""
+        self.nbytes += _nbytes(data)
+
+    def __enter__(self) -> "_Stage":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.profiler.record(self.name, time.perf_counter() - self.start, self.nbytes)
+
+
+class _NullStage:
+    """Etapa nula: con el perfilador desactivado, stage() devuelve siempre esta instancia."""
+
+    __slots__ = ()
+
+    def annotate(self, data) -> None:
+        pass
+
+    def __enter__(self) -> "_NullStage":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+# Instancia compartida: el camino desactivado no crea objetos
+_NULL_STAGE = _NullStage()
+
+
+class Profiler:
+    """
+    Instrumentación ligera de las rutas calientes: tiempos por etapa, número de llamadas
+    y tamaño de los arrays producidos. Desactivado por defecto; en ese estado cada punto
+    instrumentado cuesta una comprobación de atributo.
+    """
+
+    def __init__(self, max_events: int = 10000):
+        """
+        Args:
+            max_events (int): Eventos individuales conservados para el log estructurado.
+        """
+        self.enabled = False
+        self.stats = {}
+        self.events = deque(maxlen=max_events)
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Borra estadísticas y eventos acumulados."""
+        with self._lock:
+            self.stats.clear()
+            self.events.clear()
+
+    def stage(self, name: str):
+        """
+        Context manager que mide un bloque de código.
+
+        Ejemplo:
+            with profiler.stage("plotly.bifurcation") as s:
+                fig = build_figure(...)
+                s.annotate(x_values)
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def record(self, name: str, elapsed: float, nbytes: int = 0) -> None:
+        """Acumula una medición de la etapa 'name'."""
+        with self._lock:
+            entry = self.stats.get(name)
+            if entry is None:
+                entry = self.stats[name] = {"calls": 0, "total_s": 0.0, "max_s": 0.0, "total_bytes": 0}
+            entry["calls"] += 1
+            entry["total_s"] += elapsed
+            entry["max_s"] = max(entry["max_s"], elapsed)
+            entry["total_bytes"] += nbytes
+            self.events.append({"stage": name, "time": time.time(), "elapsed_s": elapsed, "bytes": nbytes})
+
+    def summary(self) -> list[dict]:
+        """Estadísticas por etapa ordenadas por tiempo total (mayor primero)."""
+        with self._lock:
+            rows = [dict(stage=name, **entry) for name, entry in self.stats.items()]
+        for row in rows:
+            row["mean_s"] = row["total_s"] / row["calls"]
+        return sorted(rows, key=lambda row: row["total_s"], reverse=True)
+
+    def to_json(self) -> str:
+        """Log estructurado: resumen por etapa más los eventos individuales."""
+        with self._lock:
+            events = list(self.events)
+        return json.dumps({"summary": self.summary(), "events": events}, indent=2)
+
+    def export(self, path: str) -> None:
+        """Escribe el log estructurado en un archivo JSON."""
+        with open(path, "w") as f:
+            f.write(self.to_json())
+
+
+# Perfilador global: el que usa instrument() cuando el contexto no tiene uno propio
+profiler = Profiler()
+
+# Perfilador del contexto actual (hilo o tarea). Cada sesión del dashboard activa el suyo,
+# así que activar, desactivar o reiniciar las estadísticas no afecta a otras sesiones
+_active = contextvars.ContextVar("m3_profiler", default=None)
+
+
+def set_active_profiler(active: Profiler) -> contextvars.Token:
+    """
+    Hace de 'active' el perfilador de instrument() en el contexto actual. Los hilos nuevos
+    no heredan el contexto: para trabajos en segundo plano, ejecútelos con
+    contextvars.copy_context().run (como hace JobManager).
+
+    Returns:
+        contextvars.Token: Permite restaurar el anterior con _active.reset(token).
+    """
+    return _active.set(active)
+
+
+def active_profiler() -> Profiler:
+    """Perfilador del contexto actual (el global si no se activó ninguno)."""
+    return _active.get() or profiler
+
+
+def instrument(name: str = None) -> Callable:
+    """
+    Decorador que registra tiempo, llamadas y tamaño del resultado de una función
+    en el perfilador activo del contexto (solo cuando está activado).
+
+    Args:
+        name (str, optional): Nombre de la etapa (por defecto, el __qualname__ de la función).
+    """
+    def decorator(func: Callable) -> Callable:
+        stage_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            active = _active.get() or profiler
+            if not active.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            active.record(stage_name, time.perf_counter() - start, _nbytes(result))
+            return result
+
+        return wrapper
+
+    return decorator
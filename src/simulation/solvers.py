@@ -0,0 +1,338 @@
+import numpy as np
+from typing import Callable
+
+# Firma de las funciones de derivadas por lotes: rhs(states, *args) -> dstates
+# donde states tiene forma (N, d) y cada argumento es escalar o un array (N,).
+# Los sistemas son autónomos (no dependen explícitamente de t), como Lorenz.
+BatchRHS = Callable[..., np.ndarray]
+
+# -----------------------------------------------------------------------------
+# COEFICIENTES DORMAND-PRINCE 5(4)
+# -----------------------------------------------------------------------------
+_DP_A = (
+    (),
+    (1/5,),
+    (3/40, 9/40),
+    (44/45, -56/15, 32/9),
+    (19372/6561, -25360/2187, 64448/6561, -212/729),
+    (9017/3168, -355/33, 46732/5247, 49/176, -5103/18656),
+    (35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84),
+)
+# Diferencia entre la solución de orden 5 y la de orden 4 (estimador de error)
+_DP_E = np.array([71/57600, 0.0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40])
+
+
+def _select_args(args: tuple, idx: np.ndarray) -> tuple:
+    """
+    Extrae el subconjunto de parámetros correspondiente a los miembros activos.
+    Los escalares se comparten; los arrays por miembro se indexan.
+    """
+    return tuple(a[idx] if np.ndim(a) > 0 else a for a in args)
+
+
+def _column_args(args: tuple) -> tuple:
+    """
+    Normaliza los parámetros: los arrays por miembro (N,) pasan a float64.
+    """
+    return tuple(np.asarray(a, dtype=float) for a in args)
+
+
+def rk4_step(rhs: BatchRHS, y: np.ndarray, h, args: tuple = (), k1: np.ndarray = None) -> np.ndarray:
+    """
+    Avanza un paso de Runge-Kutta clásico de orden 4 para todo el ensamble.
+
+    Args:
+        rhs (BatchRHS): Función de derivadas por lotes.
+        y (np.ndarray): Estados actuales de forma (N, d).
+        h (float | np.ndarray): Paso de tiempo (escalar o por miembro, forma (N, 1)).
+        args (tuple): Parámetros adicionales para rhs.
+        k1 (np.ndarray, optional): rhs(y) si ya se conoce (evita una evaluación).
+
+    Returns:
+        np.ndarray: Estados en t + h con forma (N, d).
+    """
+    if k1 is None:
+        k1 = rhs(y, *args)
+    k2 = rhs(y + 0.5 * h * k1, *args)
+    k3 = rhs(y + 0.5 * h * k2, *args)
+    k4 = rhs(y + h * k3, *args)
+    return y + (h / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+
+
+def rk4_ensemble(rhs: BatchRHS, y0: np.ndarray, t: np.ndarray, args: tuple = (),
+                 out_dtype=np.float64) -> np.ndarray:
+    """
+    Integra un ensamble de N condiciones iniciales con RK4 de paso fijo.
+    Todo el ensamble avanza en una sola operación de NumPy por etapa, de modo que
+    el coste depende del ancho del array y no del número de llamadas de Python.
+
+    Args:
+        rhs (BatchRHS): Función de derivadas por lotes.
+        y0 (np.ndarray): Estados iniciales de forma (N, d).
+        t (np.ndarray): Malla temporal de salida (el paso es t[k+1] - t[k]).
+        args (tuple): Parámetros adicionales para rhs (escalares o arrays (N,)).
+        out_dtype: Tipo de la historia (el estado se integra siempre en float64).
+
+    Returns:
+        np.ndarray: Array de forma (n_steps, N, d) con la historia del ensamble.
+    """
+    y = np.array(y0, dtype=float, ndmin=2)
+    args = _column_args(args)
+
+    out = np.empty((len(t),) + y.shape, dtype=out_dtype)
+    if len(t) == 0:
+        return out
+    out[0] = y
+
+    for k in range(len(t) - 1):
+        y = rk4_step(rhs, y, t[k + 1] - t[k], args)
+        out[k + 1] = y
+
+    return out
+
+
+def _dopri5_interval(rhs: BatchRHS, y: np.ndarray, f: np.ndarray, h: np.ndarray, t_start: float,
+                     t_end: float, args: tuple, rtol: float, atol: float, max_steps: int) -> None:
+    """
+    Avanza in-place todo el ensamble de t_start a t_end con Dormand-Prince 5(4).
+    Actualiza y (estados), f (derivadas, FSAL) y h (paso propuesto por miembro).
+    """
+    n_members = y.shape[0]
+    t_cur = np.full(n_members, t_start)
+    active = np.ones(n_members, dtype=bool)
+
+    for _ in range(max_steps):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            return
+
+        # Recortamos el paso para no rebasar el siguiente instante de salida
+        remaining = t_end - t_cur[idx]
+        h_try = np.minimum(h[idx], remaining)
+        hc = h_try[:, None]
+        sub_args = _select_args(args, idx)
+
+        ys = y[idx]
+        stages = [f[idx]]
+        for i in range(1, 7):
+            acc = sum(a * s for a, s in zip(_DP_A[i], stages) if a != 0.0)
+            y_stage = ys + hc * acc
+            stages.append(rhs(y_stage, *sub_args))
+
+        # La última etapa se evalúa sobre la solución de orden 5 (propiedad FSAL)
+        y_new = y_stage
+        err = hc * sum(e * s for e, s in zip(_DP_E, stages) if e != 0.0)
+
+        scale = atol + rtol * np.maximum(np.abs(ys), np.abs(y_new))
+        err_norm = np.sqrt(np.mean((err / scale) ** 2, axis=1))
+
+        accepted = err_norm <= 1.0
+        acc_idx = idx[accepted]
+        y[acc_idx] = y_new[accepted]
+        f[acc_idx] = stages[6][accepted]
+        t_cur[acc_idx] += h_try[accepted]
+
+        # Control de paso estándar con factor de seguridad y límites de crecimiento
+        with np.errstate(divide='ignore'):
+            factor = np.clip(0.9 * err_norm ** -0.2, 0.2, 10.0)
+        h_new = h_try * factor
+        # Si el paso fue recortado por la malla y se aceptó, no reducimos la propuesta
+        clipped = accepted & (h_try < h[idx])
+        h[idx] = np.where(clipped, np.maximum(h[idx], h_new), h_new)
+
+        active[acc_idx] = t_cur[acc_idx] < t_end - 1e-12 * max(1.0, abs(t_end))
+
+    raise RuntimeError(f"dopri5: se excedió max_steps en t = {t_start:.6g}")
+
+
+def dopri5_ensemble(rhs: BatchRHS, y0: np.ndarray, t: np.ndarray, args: tuple = (),
+                    rtol: float = 1e-6, atol: float = 1e-9, max_steps: int = 100000,
+                    out_dtype=np.float64) -> np.ndarray:
+    """
+    Integra un ensamble con Dormand-Prince 5(4) de paso adaptativo.
+    Cada miembro mantiene su propio tamaño de paso; los pasos aceptados y rechazados
+    se resuelven con máscaras, así que los miembros más rígidos no frenan al resto.
+    Los pasos se recortan para caer exactamente sobre la malla de salida.
+
+    Args:
+        rhs (BatchRHS): Función de derivadas por lotes.
+        y0 (np.ndarray): Estados iniciales de forma (N, d).
+        t (np.ndarray): Malla temporal de salida.
+        args (tuple): Parámetros adicionales para rhs (escalares o arrays (N,)).
+        rtol (float): Tolerancia relativa.
+        atol (float): Tolerancia absoluta.
+        max_steps (int): Límite de intentos por intervalo de salida (protección ante rigidez).
+        out_dtype: Tipo de la historia (el estado se integra siempre en float64).
+
+    Returns:
+        np.ndarray: Array de forma (n_steps, N, d) con la historia del ensamble.
+    """
+    y = np.array(y0, dtype=float, ndmin=2)
+    args = _column_args(args)
+
+    out = np.empty((len(t),) + y.shape, dtype=out_dtype)
+    if len(t) == 0:
+        return out
+    out[0] = y
+
+    # Paso inicial conservador y derivada inicial (FSAL: se reutiliza entre pasos)
+    h = np.full(y.shape[0], (t[1] - t[0]) if len(t) > 1 else 0.0)
+    f = rhs(y, *args)
+
+    for k in range(len(t) - 1):
+        _dopri5_interval(rhs, y, f, h, t[k], t[k + 1], args, rtol, atol, max_steps)
+        out[k + 1] = y
+
+    return out
+
+
+def integrate_segments(rhs: BatchRHS, y0: np.ndarray, dt: float, n_steps: int, args: tuple = (),
+                       method: str = "rk4", segment_steps: int = 4096, rtol: float = 1e-6,
+                       atol: float = 1e-9, max_steps: int = 100000):
+    """
+    Integra un ensamble sobre la malla uniforme t_k = k * dt y entrega la historia por
+    segmentos en lugar de un único array. La memoria es O(segment_steps * N * d), sin
+    importar n_steps, lo que permite volcar integraciones muy largas a disco.
+
+    Args:
+        rhs (BatchRHS): Función de derivadas por lotes.
+        y0 (np.ndarray): Estados iniciales de forma (N, d).
+        dt (float): Paso de la malla de salida.
+        n_steps (int): Número total de instantes (incluye t = 0).
+        args (tuple): Parámetros adicionales para rhs (escalares o arrays (N,)).
+        method (str): 'rk4' (paso fijo dt) o 'dopri5' (adaptativo).
+        segment_steps (int): Instantes por segmento.
+        rtol, atol (float): Tolerancias del método adaptativo.
+        max_steps (int): Límite de intentos por intervalo (solo dopri5).
+
+    Yields:
+        np.ndarray: Segmentos consecutivos de forma (m, N, d); el primero empieza en y0.
+    """
+    if method not in ("rk4", "dopri5"):
+        raise ValueError(f"Método desconocido: {method!r}. Use 'rk4' o 'dopri5'.")
+
+    y = np.array(y0, dtype=float, ndmin=2)
+    args = _column_args(args)
+    if method == "dopri5":
+        h = np.full(y.shape[0], dt)
+        f = rhs(y, *args)
+
+    for start in range(0, n_steps, segment_steps):
+        m = min(segment_steps, n_steps - start)
+        segment = np.empty((m,) + y.shape)
+        for j in range(m):
+            k = start + j
+            if k > 0:
+                if method == "rk4":
+                    y = rk4_step(rhs, y, dt, args)
+                else:
+                    _dopri5_interval(rhs, y, f, h, (k - 1) * dt, k * dt, args, rtol, atol, max_steps)
+            segment[j] = y
+        yield segment
+
+
+# -----------------------------------------------------------------------------
+# DETECCIÓN DE EVENTOS (SECCIONES DE POINCARÉ Y MAPAS DE RETORNO)
+# -----------------------------------------------------------------------------
+def plane_event(normal, offset: float = 0.0) -> Callable:
+    """
+    Evento de cruce del plano normal . y = offset.
+
+    Returns:
+        Callable: g(y, f) -> (N,), cuyo cambio de signo marca un cruce.
+    """
+    normal = np.asarray(normal, dtype=float)
+    return lambda y, f: y @ normal - offset
+
+
+def maximum_event(component: int) -> Callable:
+    """
+    Evento de máximo local de una componente (su derivada pasa de + a -).
+    Úselo con direction=-1.
+
+    Returns:
+        Callable: g(y, f) -> (N,).
+    """
+    return lambda y, f: f[:, component]
+
+
+def _hermite(y0: np.ndarray, y1: np.ndarray, f0: np.ndarray, f1: np.ndarray,
+             h: float, theta: np.ndarray) -> np.ndarray:
+    """Interpolación cúbica de Hermite dentro de un paso (theta en [0, 1])."""
+    th = theta[:, None]
+    th2, th3 = th * th, th * th * th
+    return ((2 * th3 - 3 * th2 + 1) * y0 + (th3 - 2 * th2 + th) * h * f0
+            + (-2 * th3 + 3 * th2) * y1 + (th3 - th2) * h * f1)
+
+
+def iter_section_events(rhs: BatchRHS, y0: np.ndarray, dt: float, n_steps: int, event: Callable,
+                        args: tuple = (), direction: int = 0, method: str = "rk4", segment_steps: int = 4096,
+                        rtol: float = 1e-6, atol: float = 1e-9, refine_iters: int = 40):
+    """
+    Integra un ensamble y emite solo los puntos donde el evento g(y, f) cambia de signo.
+    Cada cruce se refina por bisección sobre la interpolante cúbica de Hermite del paso
+    (error O(dt^4)), sin guardar la trayectoria: la memoria es O(N) más los eventos.
+
+    Args:
+        rhs (BatchRHS): Función de derivadas por lotes.
+        y0 (np.ndarray): Estados iniciales de forma (N, d).
+        dt (float): Paso de integración / malla.
+        n_steps (int): Número total de instantes (como en integrate_segments).
+        event (Callable): g(y, f) -> (N,), p.ej. plane_event o maximum_event.
+        args (tuple): Parámetros adicionales para rhs (escalares o arrays (N,)).
+        direction (int): +1 solo cruces de - a +, -1 solo de + a -, 0 ambos.
+        method (str): 'rk4' o 'dopri5'.
+        segment_steps (int): Pasos entre entregas de eventos.
+        rtol, atol (float): Tolerancias del método adaptativo.
+        refine_iters (int): Iteraciones de bisección por cruce.
+
+    Yields:
+        tuple: (miembros (m,), tiempos (m,), estados (m, d)) de los eventos de cada segmento.
+    """
+    if method not in ("rk4", "dopri5"):
+        raise ValueError(f"Método desconocido: {method!r}. Use 'rk4' o 'dopri5'.")
+
+    y = np.array(y0, dtype=float, ndmin=2)
+    args = _column_args(args)
+    f = rhs(y, *args)
+    g = event(y, f)
+    h = np.full(y.shape[0], dt)
+
+    found = []
+    for k in range(1, n_steps):
+        if method == "rk4":
+            y_new = rk4_step(rhs, y, dt, args, k1=f)
+            f_new = rhs(y_new, *args)
+        else:
+            y_new, f_new = y.copy(), f.copy()
+            _dopri5_interval(rhs, y_new, f_new, h, (k - 1) * dt, k * dt, args, rtol, atol, 100000)
+        g_new = event(y_new, f_new)
+
+        up = (g < 0) & (g_new >= 0)
+        down = (g > 0) & (g_new <= 0)
+        crossing = up if direction > 0 else down if direction < 0 else (up | down)
+
+        if crossing.any():
+            idx = np.flatnonzero(crossing)
+            sub_args = _select_args(args, idx)
+            y0s, y1s, f0s, f1s = y[idx], y_new[idx], f[idx], f_new[idx]
+            lo, hi = np.zeros(idx.size), np.ones(idx.size)
+            g_lo = g[idx]
+            for _ in range(refine_iters):
+                mid = 0.5 * (lo + hi)
+                y_mid = _hermite(y0s, y1s, f0s, f1s, dt, mid)
+                g_mid = event(y_mid, rhs(y_mid, *sub_args))
+                same = np.sign(g_mid) == np.sign(g_lo)
+                lo = np.where(same, mid, lo)
+                hi = np.where(same, hi, mid)
+            theta = 0.5 * (lo + hi)
+            found.append((idx, (k - 1 + theta) * dt, _hermite(y0s, y1s, f0s, f1s, dt, theta)))
+
+        y, f, g = y_new, f_new, g_new
+
+        if k % segment_steps == 0 or k == n_steps - 1:
+            if found:
+                yield tuple(np.concatenate(parts) for parts in zip(*found))
+            else:
+                yield np.empty(0, dtype=np.intp), np.empty(0), np.empty((0, y.shape[1]))
+            found = []
@@ -0,0 +1,169 @@
+import json
+import os
+import struct
+import numpy as np
+from src.simulation.precision import Quantized, encode, quantization_scale
+
+# Formato de archivo de trayectorias (.m3traj):
+#   [0:8)     magic b"M3TRAJ01"
+#   [8:12)    longitud (uint32 little-endian) de la cabecera JSON
+#   [12:...)  cabecera JSON (parámetros, dt, dtype, forma de fila, n_rows), con relleno
+#   [4096:)   datos crudos en orden C, forma (n_rows,) + row_shape
+# Los datos empiezan en un límite de página para que el memmap sea eficiente.
+# Con dtype uint16 la cabecera incluye además "offset" y "scale" (uno por eje, el último
+# eje de row_shape): valor = offset + dato * scale.
+MAGIC = b"M3TRAJ01"
+HEADER_SIZE = 4096
+
+
+def _write_header(f, header: dict) -> None:
+    payload = json.dumps(header).encode("utf-8")
+    if len(payload) > HEADER_SIZE - 12:
+        raise ValueError("La cabecera de la trayectoria excede 4 KiB (¿parámetros demasiado grandes?)")
+    f.seek(0)
+    f.write(MAGIC + struct.pack("<I", len(payload)) + payload.ljust(HEADER_SIZE - 12, b" "))
+
+
+def read_header(path: str) -> dict:
+    """Lee la cabecera JSON de un archivo de trayectoria."""
+    with open(path, "rb") as f:
+        prefix = f.read(12)
+        if prefix[:8] != MAGIC:
+            raise ValueError(f"{path} no es un archivo de trayectoria M3")
+        (length,) = struct.unpack("<I", prefix[8:12])
+        return json.loads(f.read(length))
+
+
+class TrajectoryWriter:
+    """
+    Escritor incremental de trayectorias en disco. Las filas se acumulan en un buffer de
+    chunk_rows y se vuelcan por bloques; la cabecera se actualiza en cada volcado, así que
+    un lector siempre ve un prefijo consistente aunque la integración siga en curso.
+    """
+
+    def __init__(self, path: str, row_shape: tuple, dt: float, dtype=np.float64,
+                 params: dict = None, t0: float = 0.0, chunk_rows: int = 65536, value_range: tuple = None):
+        """
+        Args:
+            path (str): Ruta del archivo (se sobrescribe).
+            row_shape (tuple): Forma de cada instante, p.ej. (3,) o (N, 3) para un ensamble.
+            dt (float): Paso de tiempo entre filas.
+            dtype: Tipo de almacenamiento (np.float32 reduce el tamaño a la mitad).
+            params (dict, optional): Metadatos (sistema, parámetros, método...).
+            t0 (float): Tiempo de la primera fila.
+            chunk_rows (int): Filas por bloque de escritura.
+            value_range (tuple, optional): (mínimos, máximos) por eje, obligatorio con dtype
+                                           np.uint16 (coordenadas cuantizadas; los valores fuera
+                                           del rango se recortan).
+        """
+        self.path = path
+        self.row_shape = tuple(int(v) for v in row_shape)
+        self.dtype = np.dtype(dtype)
+        self.header = {
+            "params": params or {},
+            "dt": float(dt),
+            "t0": float(t0),
+            "dtype": self.dtype.str,
+            "row_shape": list(self.row_shape),
+            "n_rows": 0,
+        }
+        self._quantization = None
+        if self.dtype == np.uint16:
+            if value_range is None:
+                raise ValueError("dtype uint16 requiere value_range=(mínimos, máximos) por eje")
+            offset, scale = quantization_scale(*value_range)
+            self._quantization = (offset, scale)
+            self.header.update(offset=np.broadcast_to(offset, self.row_shape[-1:]).tolist(),
+                               scale=np.broadcast_to(scale, self.row_shape[-1:]).tolist())
+        elif self.dtype.kind != "f":
+            raise ValueError(f"dtype de almacenamiento no soportado: {self.dtype} (use float64, float32 o uint16)")
+        self._buffer = np.empty((max(1, chunk_rows),) + self.row_shape, dtype=self.dtype)
+        self._buffered = 0
+        self._file = open(path, "w+b")
+        _write_header(self._file, self.header)
+
+    def __enter__(self) -> "TrajectoryWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def append(self, rows: np.ndarray) -> None:
+        """
+        Añade un segmento de forma (m,) + row_shape (se convierte al dtype de almacenamiento).
+        """
+        rows = np.asarray(rows).reshape((-1,) + self.row_shape)
+        capacity = len(self._buffer)
+        while len(rows):
+            take = min(capacity - self._buffered, len(rows))
+            target = self._buffer[self._buffered:self._buffered + take]
+            if self._quantization is None:
+                target[...] = rows[:take]
+            else:
+                encode(rows[:take], *self._quantization, out=target)
+            self._buffered += take
+            rows = rows[take:]
+            if self._buffered == capacity:
+                self.flush()
+
+    def flush(self) -> None:
+        """Vuelca el buffer al final de los datos y actualiza n_rows en la cabecera."""
+        if self._buffered:
+            self._file.seek(0, os.SEEK_END)
+            self._file.write(self._buffer[:self._buffered].tobytes())
+            self.header["n_rows"] += self._buffered
+            self._buffered = 0
+        _write_header(self._file, self.header)
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+class TrajectoryStore:
+    """
+    Lector de trayectorias en disco. Los datos se exponen como memmap de solo lectura:
+    cortar ventanas de tiempo no copia nada ni carga el archivo completo en RAM.
+    En archivos uint16, data contiene los enteros y window() devuelve Quantized.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Ruta de un archivo escrito con TrajectoryWriter.
+        """
+        self.path = path
+        self.header = read_header(path)
+        self.dt = self.header["dt"]
+        self.t0 = self.header["t0"]
+        self.params = self.header["params"]
+        shape = (self.header["n_rows"],) + tuple(self.header["row_shape"])
+        if shape[0] == 0:
+            # np.memmap no admite regiones vacías
+            self.data = np.empty(shape, dtype=np.dtype(self.header["dtype"]))
+        else:
+            self.data = np.memmap(path, dtype=np.dtype(self.header["dtype"]), mode="r",
+                                  offset=HEADER_SIZE, shape=shape)
+        self.quantized = "scale" in self.header
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+    def times(self, start: int = 0, stop: int = None) -> np.ndarray:
+        """Instantes de las filas [start, stop)."""
+        stop = len(self) if stop is None else stop
+        return self.t0 + np.arange(start, stop) * self.dt
+
+    def window(self, t_start: float, t_end: float) -> np.ndarray:
+        """
+        Vista (sin copia) de las filas con t_start <= t < t_end. En archivos cuantizados se
+        envuelve en Quantized (np.asarray la decodifica a float64).
+        """
+        start = max(0, int(np.ceil((t_start - self.t0) / self.dt - 1e-9)))
+        stop = min(len(self), int(np.ceil((t_end - self.t0) / self.dt - 1e-9)))
+        rows = self.data[start:max(start, stop)]
+        if self.quantized:
+            return Quantized(rows, self.header["offset"], self.header["scale"])
+        return rows
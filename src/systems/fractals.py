@@ -1,64 +1,311 @@
 import numpy as np
+from typing import Callable
+from src.simulation.profiling import instrument
+from src.simulation.dimensions import estimate_dimensions
+from src.simulation.precision import as_output, buffer_dtype
 
 class ChaosGame:
     """
     Implementación del 'Juego del Caos' para generar fractales geométricos.
     Demuestra cómo reglas estocásticas simples pueden generar estructuras altamente ordenadas
     como el Triángulo de Sierpinski.
+
+    Internamente todo juego es un Sistema de Funciones Iteradas (IFS) afín: la regla
+    clásica "acercarse una fracción al vértice" es la familia de mapas p -> (1-c) p + c v.
+    Esto permite usar también IFS arbitrarios (Helecho de Barnsley, Alfombra de Sierpinski).
     """
 
-    def __init__(self, vertices: np.ndarray = None):
+    def __init__(self, vertices: np.ndarray = None, matrices: np.ndarray = None,
+                 offsets: np.ndarray = None, probabilities: np.ndarray = None):
         """
-        Inicializa el juego con los vértices "atractores".
-        Si no se proveen, usa un triángulo equilátero estándar.
-        
+        Inicializa el juego con los vértices "atractores" o con un IFS afín explícito.
+        Si no se provee nada, usa un triángulo equilátero estándar.
+
         Args:
             vertices (np.ndarray, optional): Matriz de (N, 2) con las coordenadas de los vértices.
+            matrices (np.ndarray, optional): Parte lineal de M mapas afines, forma (M, 2, 2).
+            offsets (np.ndarray, optional): Traslaciones de los M mapas, forma (M, 2).
+            probabilities (np.ndarray, optional): Probabilidad de elegir cada vértice o mapa
+                                                  (por defecto, uniforme).
         """
-        if vertices is None:
-            # Triángulo equilátero por defecto
-            self.vertices = np.array([
-                [0.0, 0.0],
-                [1.0, 0.0],
-                [0.5, np.sqrt(3)/2]
-            ])
+        if matrices is not None:
+            # IFS explícito: los vértices no intervienen
+            self.matrices = np.asarray(matrices, dtype=float)
+            self.offsets = np.asarray(offsets, dtype=float)
+            self.vertices = None
+            self.n_vertices = self.matrices.shape[0]
         else:
-            self.vertices = vertices
-            
-        self.n_vertices = self.vertices.shape[0]
+            self.matrices = None
+            self.offsets = None
+            if vertices is None:
+                # Triángulo equilátero por defecto
+                self.vertices = np.array([
+                    [0.0, 0.0],
+                    [1.0, 0.0],
+                    [0.5, np.sqrt(3)/2]
+                ])
+            else:
+                self.vertices = vertices
+            self.n_vertices = self.vertices.shape[0]
+
+        if probabilities is not None:
+            probabilities = np.asarray(probabilities, dtype=float)
+            probabilities = probabilities / probabilities.sum()
+        self.probabilities = probabilities
+
+    @classmethod
+    def barnsley_fern(cls) -> "ChaosGame":
+        """Helecho de Barnsley: 4 mapas afines con probabilidades no uniformes."""
+        matrices = np.array([
+            [[0.00, 0.00], [0.00, 0.16]],
+            [[0.85, 0.04], [-0.04, 0.85]],
+            [[0.20, -0.26], [0.23, 0.22]],
+            [[-0.15, 0.28], [0.26, 0.24]],
+        ])
+        offsets = np.array([[0.0, 0.0], [0.0, 1.6], [0.0, 1.6], [0.0, 0.44]])
+        return cls(matrices=matrices, offsets=offsets, probabilities=[0.01, 0.85, 0.07, 0.07])
+
+    @classmethod
+    def sierpinski_carpet(cls) -> "ChaosGame":
+        """Alfombra de Sierpinski: 8 contracciones de razón 1/3 (se omite el centro)."""
+        cells = [(i, j) for i in range(3) for j in range(3) if (i, j) != (1, 1)]
+        matrices = np.tile(np.eye(2) / 3.0, (len(cells), 1, 1))
+        offsets = np.array(cells, dtype=float) / 3.0
+        return cls(matrices=matrices, offsets=offsets)
+
+    def affine_maps(self, compression_factor: float = 0.5) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Devuelve el IFS afín equivalente al juego: p -> A_k p + b_k.
+
+        Args:
+            compression_factor (float): Fracción del camino hacia el vértice (solo regla de vértices).
+
+        Returns:
+            tuple: (matrices (M, 2, 2), offsets (M, 2)).
+        """
+        if self.matrices is not None:
+            return self.matrices, self.offsets
 
-    def generate_points(self, n_steps: int, compression_factor: float = 0.5) -> np.ndarray:
+        # Nueva posición = Actual + (Vértice - Actual) * c  =  (1 - c) * Actual + c * Vértice
+        matrices = np.tile(np.eye(2) * (1.0 - compression_factor), (self.n_vertices, 1, 1))
+        offsets = compression_factor * np.asarray(self.vertices, dtype=float)
+        return matrices, offsets
+
+    @instrument()
+    def generate_points(self, n_steps: int, compression_factor: float = 0.5, n_walkers: int = None,
+                        transient: int = 50, seed=None, output_dtype: str = "float64") -> np.ndarray:
         """
-        Ejecuta la simulación del juego del caos.
-        
+        Ejecuta la simulación del juego del caos con muchos caminantes en paralelo.
+        Todos los caminantes avanzan a la vez como un array (n_walkers, 2), por lo que el
+        número de iteraciones de Python es n_steps / n_walkers y no n_steps.
+
         Args:
             n_steps (int): Número total de puntos a generar.
             compression_factor (float): Qué tanto nos acercamos al vértice elegido (0.5 = mitad de camino).
-            
+            n_walkers (int, optional): Caminantes independientes (por defecto ~n_steps / 100).
+            transient (int): Pasos iniciales que se descartan en cada caminante antes de registrar.
+            seed (int, optional): Semilla del generador aleatorio.
+            output_dtype (str): "float64", "float32" o "uint16". Con "float32" (y "uint16", que
+                                cuantiza con el rango real de cada eje) los caminantes se iteran en
+                                float32: los mapas son contractivos, así que el redondeo no se
+                                acumula y los puntos siguen a los de float64 (misma semilla) con
+                                un error del orden de 1e-7 del tamaño del atractor.
+
         Returns:
-            np.ndarray: Matriz de (n_steps, 2) con las coordenadas X, Y de los puntos generados.
+            np.ndarray | Quantized: Matriz de (n_steps, 2) con las coordenadas X, Y de los puntos generados.
         """
         # Pre-localizamos memoria para velocidad (Optimization Senior)
-        points = np.zeros((n_steps, 2))
-        
-        # Punto inicial aleatorio dentro del área aproximada
-        current_point = np.random.rand(2)
-        
-        # Elegimos aleatoriamente qué vértice usaremos en cada paso por adelantado
-        random_vertices_indices = np.random.randint(0, self.n_vertices, size=n_steps)
-        
-        # Iteración principal (El núcleo del juego)
-        for i in range(n_steps):
-            # 1. Elegir el vértice objetivo basado en el índice aleatorio
-            target_vertex = self.vertices[random_vertices_indices[i]]
-            
-            # 2. Moverse una fracción del camino hacia ese vértice
-            # Nueva posición = Actual + (Vector dirección * factor)
-            current_point = current_point + (target_vertex - current_point) * compression_factor
-            
-            # 3. Guardar el punto
-            points[i] = current_point
-            
-        # Descartamos los primeros puntos (transitorio) para limpiar la imagen
-        cutoff = int(n_steps * 0.01) # Descartar el primer 1%
-        return points[cutoff:]
+        dtype = buffer_dtype(output_dtype)
+        points = np.empty((n_steps, 2), dtype=dtype)
+
+        filled = 0
+        for block in self.iter_point_blocks(n_steps, compression_factor, n_walkers, transient, seed, dtype=dtype):
+            points[filled:filled + len(block)] = block
+            filled += len(block)
+
+        if not len(points):
+            return as_output(points, output_dtype)
+        return as_output(points, output_dtype, points.min(axis=0), points.max(axis=0))
+
+    def iter_point_blocks(self, n_steps: int, compression_factor: float = 0.5, n_walkers: int = None,
+                          transient: int = 50, seed=None, block_size: int = 1_000_000, dtype=np.float64):
+        """
+        Genera los puntos del juego en bloques de tamaño acotado.
+        Cada bloque es una vista sobre un buffer reutilizado: es válido solo hasta pedir
+        el siguiente (cópielo si necesita conservarlo). La memoria pico es O(block_size).
+
+        Args:
+            n_steps (int): Número total de puntos a generar.
+            compression_factor (float): Qué tanto nos acercamos al vértice elegido.
+            n_walkers (int, optional): Caminantes independientes (por defecto ~n_steps / 100).
+            transient (int): Pasos iniciales que se descartan en cada caminante.
+            seed (int | np.random.Generator, optional): Semilla o generador (un Generator
+                                                        continúa su secuencia entre llamadas).
+            block_size (int): Máximo de puntos por bloque.
+            dtype: Tipo de los caminantes y de los bloques (np.float32 es seguro: ver generate_points).
+
+        Yields:
+            np.ndarray: Bloques de forma (m, 2) con m <= block_size.
+        """
+        rng = np.random.default_rng(seed)
+        if n_walkers is None:
+            n_walkers = int(np.clip(n_steps // 100, 1, 65536))
+        n_walkers = max(1, min(n_walkers, n_steps, block_size))
+        rounds = -(-n_steps // n_walkers)
+        rounds_per_block = max(1, block_size // n_walkers)
+        coefficients = self._coefficients(compression_factor).astype(dtype)
+
+        buffer = np.empty((min(rounds, rounds_per_block), n_walkers, 2), dtype=dtype)
+
+        # Punto inicial aleatorio por caminante; el transitorio los lleva al atractor.
+        # Se sortea en float64 para consumir la misma secuencia aleatoria con cualquier dtype
+        walkers = rng.random((n_walkers, 2)).astype(dtype)
+        for _ in range(transient):
+            walkers = self._step(walkers, rng, coefficients)
+
+        remaining = n_steps
+        for start in range(0, rounds, rounds_per_block):
+            n_rounds = min(rounds_per_block, rounds - start)
+            for i in range(n_rounds):
+                walkers = self._step(walkers, rng, coefficients)
+                buffer[i] = walkers
+
+            block = buffer[:n_rounds].reshape(-1, 2)[:remaining]
+            remaining -= len(block)
+            yield block
+
+    @instrument()
+    def accumulate_density(self, n_steps: int, resolution: tuple = (512, 512), bounds: tuple = None,
+                           counts: np.ndarray = None, compression_factor: float = 0.5, n_walkers: int = None,
+                           transient: int = 50, seed=None, block_size: int = 1_000_000,
+                           progress: Callable = None) -> tuple[np.ndarray, tuple]:
+        """
+        Acumula los puntos del juego en una rejilla de conteos sin materializarlos.
+        Los puntos se generan por bloques, se binean y se descartan, así que la memoria
+        pico depende solo de block_size y de la rejilla.
+
+        Para refinamiento progresivo, pase la rejilla y los límites devueltos por una llamada
+        anterior (y un Generator o una semilla distinta para no repetir los mismos puntos).
+
+        Args:
+            n_steps (int): Número de puntos a acumular en esta llamada.
+            resolution (tuple): Celdas (nx, ny) de la rejilla (ignorado si se pasa counts).
+            bounds (tuple, optional): Ventana (x_min, x_max, y_min, y_max). Por defecto se
+                                      estima a partir de una corrida corta del atractor.
+            counts (np.ndarray, optional): Rejilla existente (ny, nx) a la que se suman los conteos.
+            compression_factor (float): Qué tanto nos acercamos al vértice elegido.
+            n_walkers (int, optional): Caminantes independientes.
+            transient (int): Pasos iniciales que se descartan en cada caminante.
+            seed (int | np.random.Generator, optional): Semilla o generador.
+            block_size (int): Máximo de puntos generados por bloque.
+            progress (Callable, optional): progress(fracción) tras cada bloque acumulado.
+
+        Returns:
+            tuple: (conteos (ny, nx) int64, bounds) con las filas en el eje y (listo como imagen).
+        """
+        rng = np.random.default_rng(seed)
+        if bounds is None:
+            bounds = self._estimate_bounds(compression_factor, rng)
+        x_min, x_max, y_min, y_max = bounds
+
+        if counts is None:
+            nx, ny = resolution
+            counts = np.zeros((ny, nx), dtype=np.int64)
+        ny, nx = counts.shape
+        flat_counts = counts.reshape(-1)
+
+        sx = nx / (x_max - x_min)
+        sy = ny / (y_max - y_min)
+        n_done = 0
+        for block in self.iter_point_blocks(n_steps, compression_factor, n_walkers, transient, rng, block_size):
+            ix = np.floor((block[:, 0] - x_min) * sx)
+            iy = np.floor((block[:, 1] - y_min) * sy)
+            # Los puntos fuera de la ventana se descartan
+            valid = (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
+            flat = iy[valid].astype(np.intp) * nx + ix[valid].astype(np.intp)
+            flat_counts += np.bincount(flat, minlength=nx * ny)
+            n_done += len(block)
+            if progress is not None:
+                progress(n_done / n_steps)
+
+        return counts, tuple(bounds)
+
+    @instrument()
+    def fractal_dimensions(self, n_steps: int, max_level: int = 10, box_levels: tuple = (2, None),
+                           n_reference: int = 1000, compression_factor: float = 0.5, n_walkers: int = None,
+                           transient: int = 50, seed=None, block_size: int = 1_000_000,
+                           progress: Callable = None) -> dict:
+        """
+        Cuantifica la autosimilaridad del atractor: dimensión de conteo de cajas y dimensión
+        de correlación (Grassberger–Procaccia), en una sola pasada por bloques y sin
+        materializar los puntos (memoria acotada también para 10**7 puntos o más).
+        Para el triángulo de Sierpinski ambas tienden a log 3 / log 2 ≈ 1.585.
+
+        Args:
+            n_steps (int): Número de puntos analizados.
+            max_level (int): Nivel más fino del conteo de cajas (2**max_level cajas por eje).
+                             Debe haber bastantes más puntos que cajas ocupadas en ese nivel.
+            box_levels (tuple): Niveles (mínimo, máximo) del ajuste de la dimensión de cajas.
+            n_reference (int): Puntos de referencia para la suma de correlación.
+            compression_factor (float): Qué tanto nos acercamos al vértice elegido.
+            n_walkers (int, optional): Caminantes independientes.
+            transient (int): Pasos iniciales que se descartan en cada caminante.
+            seed (int, optional): Semilla (juego y muestreo de referencias).
+            block_size (int): Máximo de puntos por bloque.
+            progress (Callable, optional): progress(fracción) tras cada bloque.
+
+        Returns:
+            dict: Ver estimate_dimensions ('box_dimension', 'correlation_dimension', curvas...).
+        """
+        rng = np.random.default_rng(seed)
+        bounds = self._estimate_bounds(compression_factor, rng)
+
+        def blocks():
+            n_done = 0
+            for block in self.iter_point_blocks(n_steps, compression_factor, n_walkers, transient, rng, block_size):
+                yield block
+                n_done += len(block)
+                if progress is not None:
+                    progress(n_done / n_steps)
+
+        return estimate_dimensions(blocks(), bounds, max_level, box_levels, n_reference=n_reference, seed=rng)
+
+    def _estimate_bounds(self, compression_factor: float, rng: np.random.Generator, padding: float = 0.02) -> tuple:
+        """
+        Ventana que contiene al atractor. Para la regla de vértices el atractor está dentro
+        de la envolvente de los vértices; para IFS arbitrarios se usa una corrida corta.
+        """
+        if self.vertices is not None:
+            sample = np.asarray(self.vertices, dtype=float)
+        else:
+            sample = self.generate_points(20000, compression_factor, seed=rng)
+
+        low, high = sample.min(axis=0), sample.max(axis=0)
+        pad = padding * np.maximum(high - low, 1e-12)
+        return (float(low[0] - pad[0]), float(high[0] + pad[0]), float(low[1] - pad[1]), float(high[1] + pad[1]))
+
+    def _coefficients(self, compression_factor: float) -> np.ndarray:
+        """
+        Empaqueta el IFS en una tabla (M, 6) [a00, a01, a10, a11, b0, b1] para que cada
+        paso haga un único gather de filas contiguas.
+        """
+        matrices, offsets = self.affine_maps(compression_factor)
+        return np.column_stack([matrices.reshape(-1, 4), offsets])
+
+    def _step(self, walkers: np.ndarray, rng: np.random.Generator, coefficients: np.ndarray) -> np.ndarray:
+        """
+        Aplica a cada caminante un mapa afín elegido al azar (una sola operación vectorizada).
+        """
+        # Elegimos aleatoriamente qué mapa (vértice) usa cada caminante
+        if self.probabilities is None:
+            k = rng.integers(0, self.n_vertices, size=walkers.shape[0])
+        else:
+            k = rng.choice(self.n_vertices, size=walkers.shape[0], p=self.probabilities)
+
+        # p' = A_k p + b_k, expandido por componentes
+        c = coefficients[k]
+        x, y = walkers[:, 0], walkers[:, 1]
+        new = np.empty_like(walkers)
+        new[:, 0] = c[:, 0] * x + c[:, 1] * y + c[:, 4]
+        new[:, 1] = c[:, 2] * x + c[:, 3] * y + c[:, 5]
+        return new
@@ -0,0 +1,126 @@
+"""
+Registro de sistemas con importación diferida. Los motores (y sus dependencias numéricas,
+como SciPy) se importan la primera vez que se piden, no al importar el registro; así el
+dashboard puede pintar su portada sin pagar la inicialización de todos los módulos.
+
+Uso:
+    LogisticMap = get_system("logistic")
+    go = LazyModule("plotly.graph_objects")   # se importa en el primer go.Figure(...)
+
+Calentamiento previo (rellena la caché en disco con los resultados por defecto):
+    python -m src.systems.registry
+"""
+import importlib
+import threading
+import time
+
+# nombre -> (módulo, clase)
+SYSTEMS = {
+    "logistic": ("src.systems.discrete", "LogisticMap"),
+    "lorenz": ("src.systems.continuous", "LorenzSystem"),
+    "chaos_game": ("src.systems.fractals", "ChaosGame"),
+}
+
+# Cálculos con los parámetros por defecto del dashboard: (sistema, argumentos del
+# constructor o None para métodos estáticos, método, args, kwargs) para ResultCache.call
+DEFAULT_CALLS = [
+    ("logistic", None, "generate_bifurcation_data", (2.5, 4.0, 1000, 100, 800),
+     {"seed": 0, "chunk_size": 100, "output_dtype": "float32"}),
+    ("logistic", None, "generate_bifurcation_density", (2.5, 4.0, 2000, 1000, 2000),
+     {"x_bins": 800, "max_period": 32, "seed": 0, "chunk_size": 200}),
+    ("chaos_game", {}, "accumulate_density", (200000,),
+     {"resolution": (600, 600), "seed": 0, "block_size": 250000}),
+]
+
+_loaded = {}
+_lock = threading.Lock()
+
+
+class LazyModule:
+    """
+    Sustituto de un módulo que lo importa en el primer acceso a un atributo.
+    """
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name (str): Nombre completo del módulo (p.ej. "plotly.graph_objects").
+        """
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+
+def get_system(name: str) -> type:
+    """
+    Clase del sistema 'name', importando su módulo si es el primer uso.
+
+    Args:
+        name (str): Clave del registro ("logistic", "lorenz", "chaos_game").
+
+    Returns:
+        type: Clase del sistema.
+    """
+    if name not in SYSTEMS:
+        raise KeyError(f"Sistema desconocido '{name}'. Disponibles: {', '.join(SYSTEMS)}")
+    with _lock:
+        if name not in _loaded:
+            module_name, class_name = SYSTEMS[name]
+            _loaded[name] = getattr(importlib.import_module(module_name), class_name)
+        return _loaded[name]
+
+
+def loaded_systems() -> list[str]:
+    """Sistemas ya importados en este proceso."""
+    return list(_loaded)
+
+
+def warm_up(cache=None, calls: list = None, preload: tuple = ("scipy.integrate",)) -> dict:
+    """
+    Importa los motores y calcula los resultados por defecto para que la primera
+    interacción real no pague ni la importación ni el cálculo.
+
+    Args:
+        cache (ResultCache, optional): Caché donde guardar los resultados (por defecto la de disco).
+        calls (list, optional): Cálculos a precalcular (por defecto DEFAULT_CALLS).
+        preload (tuple): Módulos adicionales a importar (dependencias numéricas).
+
+    Returns:
+        dict: Segundos empleados por etapa ("import.<módulo>", "<sistema>.<método>").
+    """
+    from src.simulation.cache import ResultCache
+
+    cache = ResultCache() if cache is None else cache
+    timings = {}
+    for module_name in preload:
+        start = time.perf_counter()
+        importlib.import_module(module_name)
+        timings[f"import.{module_name}"] = time.perf_counter() - start
+
+    for name, init_kwargs, method, args, kwargs in (DEFAULT_CALLS if calls is None else calls):
+        start = time.perf_counter()
+        cls = get_system(name)
+        target = cls if init_kwargs is None else cls(**init_kwargs)
+        cache.call(target, method, *args, **kwargs)
+        timings[f"{name}.{method}"] = time.perf_counter() - start
+    return timings
+
+
+def warm_up_in_background(cache=None, calls: list = None,
+                          preload: tuple = ("scipy.integrate",)) -> threading.Thread:
+    """Lanza warm_up en un hilo daemon (p.ej. tras pintar la portada del dashboard)."""
+    thread = threading.Thread(target=warm_up, args=(cache, calls, preload), name="m3-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+if __name__ == "__main__":
+    for stage, seconds in warm_up().items():
+        print(f"{stage:<45s} {seconds:8.3f} s")
@@ -0,0 +1,155 @@
+import numpy as np
+
+# Presupuesto de datos por figura: lo que se envía al navegador no depende del tamaño
+# de la simulación, solo de estos límites.
+MAX_LINE_POINTS = 4000
+RASTER_SHAPE = (600, 800)  # (ny, nx)
+
+
+def lttb_indices(points: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: elige n_out vértices de una polilínea preservando su
+    forma. Los puntos intermedios se reparten en n_out - 2 cubetas consecutivas y de cada
+    una se toma el vértice que forma el triángulo de mayor área con el elegido en la
+    cubeta anterior y el promedio de la siguiente. Extremos siempre incluidos.
+
+    Args:
+        points (np.ndarray): Serie (n,) (el eje x es el índice) o polilínea (n, d) en
+                             cualquier dimensión (p.ej. trayectorias 3D).
+        n_out (int): Número de vértices a conservar (>= 3).
+
+    Returns:
+        np.ndarray: Índices crecientes de los vértices elegidos.
+    """
+    points = np.asarray(points, dtype=float)
+    if points.ndim == 1:
+        points = np.column_stack([np.arange(len(points), dtype=float), points])
+    n = len(points)
+    if n_out >= n:
+        return np.arange(n)
+    if n_out < 3:
+        raise ValueError("n_out debe ser al menos 3 (los extremos más un vértice interior)")
+
+    # Cubetas [edges[i], edges[i+1]) sobre los índices 1..n-2; ninguna queda vacía porque n_out < n
+    edges = np.floor(np.linspace(1, n - 1, n_out - 1)).astype(np.intp)
+    sums = np.add.reduceat(points[1:n - 1], edges[:-1] - 1, axis=0)
+    means = sums / np.diff(edges)[:, None]
+    next_means = np.vstack([means[1:], points[-1:]])
+
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    anchor = points[0]
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        u = points[lo:hi] - anchor
+        v = next_means[i] - anchor
+        # Área^2 (x4) por la identidad de Lagrange: |u|^2 |v|^2 - (u.v)^2, válida en d dimensiones
+        area2 = np.einsum("ij,ij->i", u, u) * (v @ v) - (u @ v) ** 2
+        best = lo + int(np.argmax(area2))
+        selected[i + 1] = best
+        anchor = points[best]
+    return selected
+
+
+def decimate_line(points: np.ndarray, max_points: int = MAX_LINE_POINTS) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce una trayectoria a lo sumo a max_points vértices con LTTB.
+
+    Args:
+        points (np.ndarray): Serie (n,) o polilínea (n, d).
+        max_points (int): Máximo de vértices a enviar al navegador.
+
+    Returns:
+        tuple: (puntos reducidos, índices elegidos). Los índices sirven para reducir de
+               forma coherente otros arrays alineados (tiempos, colores por vértice...).
+    """
+    idx = lttb_indices(points, max_points)
+    return np.asarray(points)[idx], idx
+
+
+def rasterize(x: np.ndarray, y: np.ndarray, shape: tuple = RASTER_SHAPE, bounds: tuple = None,
+              counts: np.ndarray = None) -> tuple[np.ndarray, tuple]:
+    """
+    Agrega una nube de puntos en una imagen de conteos de tamaño fijo.
+
+    Args:
+        x, y (np.ndarray): Coordenadas de los puntos.
+        shape (tuple): Píxeles (ny, nx) de la imagen (ignorado si se pasa counts).
+        bounds (tuple, optional): Ventana (x_min, x_max, y_min, y_max). Por defecto, la
+                                  envolvente de los puntos.
+        counts (np.ndarray, optional): Imagen existente (ny, nx) a la que se suman los
+                                       conteos (para agregar por bloques).
+
+    Returns:
+        tuple: (conteos (ny, nx) int64 con la fila 0 en y_min, bounds).
+    """
+    x = np.asarray(x, dtype=float).ravel()
+    y = np.asarray(y, dtype=float).ravel()
+    if bounds is None:
+        bounds = (float(x.min()), float(x.max()), float(y.min()), float(y.max()))
+    x_min, x_max, y_min, y_max = bounds
+
+    if counts is None:
+        counts = np.zeros(shape, dtype=np.int64)
+    ny, nx = counts.shape
+
+    ix = np.floor((x - x_min) * (nx / max(x_max - x_min, 1e-12)))
+    iy = np.floor((y - y_min) * (ny / max(y_max - y_min, 1e-12)))
+    # El borde superior de la ventana cae en el último píxel, no fuera de la imagen
+    ix[x == x_max] = nx - 1
+    iy[y == y_max] = ny - 1
+    valid = (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
+    flat = iy[valid].astype(np.intp) * nx + ix[valid].astype(np.intp)
+    counts.reshape(-1)[:] += np.bincount(flat, minlength=nx * ny)
+    return counts, tuple(bounds)
+
+
+def pool_counts(counts: np.ndarray, max_shape: tuple = RASTER_SHAPE) -> np.ndarray:
+    """
+    Reduce una rejilla de conteos sumando bloques enteros de celdas, de modo que ninguna
+    dimensión exceda max_shape. Los conteos totales se conservan.
+
+    Args:
+        counts (np.ndarray): Rejilla (ny, nx).
+        max_shape (tuple): Tamaño máximo (ny, nx) del resultado.
+
+    Returns:
+        np.ndarray: Rejilla reducida (la misma si ya cabe).
+    """
+    ny, nx = counts.shape
+    fy = -(-ny // max_shape[0])
+    fx = -(-nx // max_shape[1])
+    if fy == 1 and fx == 1:
+        return counts
+    padded = np.zeros((-(-ny // fy) * fy, -(-nx // fx) * fx), dtype=counts.dtype)
+    padded[:ny, :nx] = counts
+    return padded.reshape(padded.shape[0] // fy, fy, padded.shape[1] // fx, fx).sum(axis=(1, 3))
+
+
+def shade(counts: np.ndarray, log: bool = True) -> np.ndarray:
+    """
+    Convierte conteos en intensidades uint8 (0 = vacío, 255 = celda más densa). La escala
+    logarítmica mantiene visibles las regiones poco visitadas del atractor; uint8 reduce
+    la carga de la figura a un byte por píxel.
+
+    Args:
+        counts (np.ndarray): Rejilla de conteos (ny, nx).
+        log (bool): Escala logarítmica (log1p) en lugar de lineal.
+
+    Returns:
+        np.ndarray: Intensidades (ny, nx) uint8.
+    """
+    values = np.log1p(counts, dtype=float) if log else counts.astype(float)
+    peak = values.max() if values.size else 0.0
+    if peak <= 0:
+        return np.zeros(counts.shape, dtype=np.uint8)
+    return np.rint(values * (255.0 / peak)).astype(np.uint8)
+
+
+def pixel_centers(bounds: tuple, shape: tuple) -> tuple[np.ndarray, np.ndarray]:
+    """Coordenadas (x, y) de los centros de píxel de una imagen (ny, nx) sobre bounds."""
+    x_min, x_max, y_min, y_max = bounds
+    ny, nx = shape
+    x = x_min + (np.arange(nx) + 0.5) * ((x_max - x_min) / nx)
+    y = y_min + (np.arange(ny) + 0.5) * ((y_max - y_min) / ny)
+    return x, y
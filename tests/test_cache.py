@@ -0,0 +1,39 @@
+import numpy as np
+
+from src.simulation.cache import ResultCache
+from src.systems.discrete import LogisticMap
+from src.systems.fractals import ChaosGame
+
+
+def test_call_reuses_seeded_results(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    
+    first = cache.call(ChaosGame(), "generate_points", 1000, seed=0)
+    again = cache.call(ChaosGame(), "generate_points", 1000, seed=0)
+    
+    assert isinstance(again, np.memmap)
+    np.testing.assert_array_equal(first, again)
+
+
+def test_call_without_seed_is_not_cached(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    
+    first = cache.call(ChaosGame(), "generate_points", 1000)
+    again = cache.call(ChaosGame(), "generate_points", 1000)
+    unseeded = cache.call(LogisticMap, "generate_bifurcation_data", 2.5, 4.0, 200, 10, 50)
+    generator = cache.call(ChaosGame(), "generate_points", 1000, seed=np.random.default_rng(0))
+    
+    assert not np.array_equal(first, again)
+    assert not isinstance(unseeded[1], np.memmap)
+    assert not isinstance(generator, np.memmap)
+    assert cache.size() == 0
+
+
+def test_call_key_ignores_private_state(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    model = LogisticMap(r=3.9)
+    
+    short = cache.call(model, "simulate", 0.1, 100)
+    longer = cache.call(model, "simulate", 0.1, 200)
+    
+    np.testing.assert_array_equal(longer[:100], short)
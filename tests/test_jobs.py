@@ -0,0 +1,59 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.simulation.jobs import JobCancelled, JobManager
+
+
+def test_failed_job_is_retried_with_same_key():
+    manager = JobManager(max_workers=1)
+    attempts = []
+    
+    def flaky(progress):
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("fallo transitorio")
+        return "ok"
+    
+    first = manager.submit("slot", 1, flaky)
+    with pytest.raises(RuntimeError):
+        first.result(timeout=5)
+    assert first.failed()
+    
+    second = manager.submit("slot", 1, flaky)
+    
+    assert second is not first
+    assert second.result(timeout=5) == "ok"
+    assert manager.submit("slot", 1, flaky) is second
+    manager.shutdown()
+
+
+def test_cancelled_job_is_not_failed():
+    manager = JobManager(max_workers=1)
+    started = threading.Event()
+    
+    def slow(progress):
+        started.set()
+        while True:
+            progress(0.5)
+    
+    job = manager.submit("slot", 1, slow)
+    started.wait(5)
+    manager.cancel("slot")
+    
+    with pytest.raises(JobCancelled):
+        job.result(timeout=5)
+    assert not job.failed()
+    manager.shutdown()
+
+
+def test_shared_executor_survives_manager_shutdown():
+    executor = ThreadPoolExecutor(max_workers=1)
+    first, second = JobManager(executor=executor), JobManager(executor=executor)
+    
+    assert first.submit("slot", 1, lambda progress: 1).result(timeout=5) == 1
+    first.shutdown()
+    
+    assert second.submit("slot", 1, lambda progress: 2).result(timeout=5) == 2
+    executor.shutdown()
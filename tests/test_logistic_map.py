@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from src.systems.discrete import LogisticMap, _run_transient
+
+
+def _reference(x0, r, steps):
+    """Iteración directa, trayectoria a trayectoria, con el tiempo en el último eje."""
+    x0, r = np.broadcast_arrays(np.asarray(x0, dtype=float), np.asarray(r, dtype=float))
+    history = np.empty(x0.shape + (steps,))
+    for index in np.ndindex(x0.shape):
+        x = x0[index]
+        for t in range(steps):
+            history[index + (t,)] = x
+            x = r[index] * x * (1 - x)
+    return history
+
+
+@pytest.mark.parametrize("keep_last", [None, 2])
+def test_simulate_batch_broadcast_2d(keep_last):
+    x0 = np.array([[0.1], [0.2]])
+    r = np.array([[3.5, 3.7, 3.9]])
+    expected = _reference(x0, r, 5)
+    
+    result = LogisticMap.simulate_batch(x0, r, 5, keep_last=keep_last)
+    
+    assert result.shape == (2, 3, 5 if keep_last is None else keep_last)
+    np.testing.assert_array_equal(result, expected[..., -result.shape[-1]:])
+
+
+def test_simulate_batch_running_stats_last_2d():
+    x0 = np.array([[0.1], [0.2]])
+    r = np.array([[3.5, 3.7, 3.9]])
+    
+    stats = LogisticMap.simulate_batch(x0, r, 6, keep_last=3, running_stats=True)
+    
+    assert stats["mean"].shape == (2, 3)
+    np.testing.assert_array_equal(stats["last"], _reference(x0, r, 6)[..., -3:])
+
+
+def _iterate_plain(r, x, steps):
+    for _ in range(steps):
+        x = r * x * (1 - x)
+    return x
+
+
+@pytest.mark.parametrize("n_lanes", [3, 200])
+def test_run_transient_without_detection_matches_plain_iteration(n_lanes):
+    r = np.linspace(2.5, 4.0, n_lanes)
+    x = np.random.default_rng(0).random(n_lanes)
+    
+    final, period, _, _ = _run_transient(r, x, 1000, 0, 1e-10)
+    
+    np.testing.assert_array_equal(final, _iterate_plain(r, x, 1000))
+    assert not period.any()
+
+
+def test_run_transient_detects_known_periods():
+    r = np.array([2.8, 3.2, 3.5, 3.835, 3.9])
+    x = np.full(r.shape, 0.3)
+    
+    final, period, _, _ = _run_transient(r, x, 3000, 32, 1e-10)
+    
+    np.testing.assert_array_equal(period, [1, 2, 4, 3, 0])
+    # Los carriles no detectados terminan exactamente como con la iteración directa
+    assert final[4] == _iterate_plain(r[4], x[4], 3000)
+
+
+@pytest.mark.parametrize("kind", ["data", "density"])
+def test_periodic_fill_matches_plain_iteration(kind):
+    args = (2.5, 4.0, 3000, 200, 600)
+    if kind == "data":
+        plain = LogisticMap.generate_bifurcation_data(*args, seed=3)
+        filled = LogisticMap.generate_bifurcation_data(*args, seed=3, max_period=32, tol=1e-12)
+        period = filled[2]
+        x_plain, x_filled = plain[1].reshape(200, 600), filled[1].reshape(200, 600)
+        
+        assert (period > 0).mean() > 0.5
+        np.testing.assert_array_equal(x_filled[:, period == 0], x_plain[:, period == 0])
+        np.testing.assert_allclose(x_filled[:, period > 0], x_plain[:, period > 0], rtol=0, atol=1e-8)
+    else:
+        plain = LogisticMap.generate_bifurcation_density(*args, seed=3, x_bins=100)
+        filled = LogisticMap.generate_bifurcation_density(*args, seed=3, x_bins=100, max_period=32, tol=1e-12)
+        
+        np.testing.assert_array_equal(filled[2].sum(axis=1), plain[2].sum(axis=1))
+        # Una muestra a menos de tol de un borde de celda puede caer en la vecina
+        assert np.abs(filled[2].astype(int) - plain[2].astype(int)).sum() <= 0.001 * plain[2].sum()
+
+
+def test_simulate_reuses_prefix_and_matches_full_run():
+    model = LogisticMap(r=3.9)
+    
+    short = model.simulate(0.2, 100)
+    history = model._last_run[1]
+    longer = model.simulate(0.2, 300)
+    
+    assert model._last_run[1] is history and len(history) == 300
+    np.testing.assert_array_equal(longer[:100], short)
+    np.testing.assert_array_equal(longer, LogisticMap(r=3.9).simulate(0.2, 300))
+    np.testing.assert_array_equal(longer, _reference(0.2, 3.9, 300))
+
+
+def test_simulate_restarts_when_inputs_change():
+    model = LogisticMap(r=3.9)
+    model.simulate(0.2, 100)
+    
+    model.r = 3.7
+    
+    np.testing.assert_array_equal(model.simulate(0.2, 50), _reference(0.2, 3.7, 50))
+    np.testing.assert_array_equal(model.simulate(0.3, 50), _reference(0.3, 3.7, 50))
@@ -0,0 +1,36 @@
+import numpy as np
+
+from src.systems.continuous import LorenzRun, LorenzSystem
+
+
+def test_extend_to_reuses_prefix_and_matches_full_run():
+    system = LorenzSystem()
+    run = LorenzRun(system, (1.0, 1.0, 1.0))
+    
+    short = run.extend_to(5.0).copy()
+    longer = run.extend_to(10.0)
+    full = system.simulate(1.0, 1.0, 1.0, 10.0)
+    
+    assert longer.shape == full.shape
+    np.testing.assert_array_equal(longer[:len(short)], short)
+    np.testing.assert_allclose(longer, full, rtol=0, atol=1e-3)
+
+
+def test_extend_to_shorter_duration_is_a_prefix():
+    run = LorenzRun(LorenzSystem(), (1.0, 1.0, 1.0))
+    longer = run.extend_to(4.0).copy()
+    
+    shorter = run.extend_to(2.0)
+    
+    assert run.time == (len(longer) - 1) * run.dt
+    np.testing.assert_array_equal(shorter, longer[:len(shorter)])
+
+
+def test_extend_to_with_progress_matches_single_segment():
+    system = LorenzSystem()
+    reports = []
+    
+    segmented = LorenzRun(system, (1.0, 1.0, 1.0)).extend_to(5.0, progress=reports.append, segment_steps=120)
+    
+    assert reports[-1] == 1.0 and reports == sorted(reports)
+    np.testing.assert_allclose(segmented, system.simulate(1.0, 1.0, 1.0, 5.0), rtol=0, atol=1e-3)
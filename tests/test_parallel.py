@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from src.systems.discrete import LogisticMap
+
+
+@pytest.mark.parametrize("max_period", [0, 32])
+def test_bifurcation_data_independent_of_workers(max_period):
+    args = (2.5, 4.0, 500, 50, 1000)
+    kwargs = dict(seed=7, chunk_size=128, max_period=max_period)
+    
+    serial = LogisticMap.generate_bifurcation_data(*args, n_workers=1, **kwargs)
+    parallel = LogisticMap.generate_bifurcation_data(*args, n_workers=2, **kwargs)
+    
+    assert len(serial) == len(parallel)
+    for expected, result in zip(serial, parallel):
+        np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize("max_period", [0, 32])
+def test_bifurcation_density_independent_of_workers(max_period):
+    args = (2.5, 4.0, 500, 200, 1000)
+    kwargs = dict(seed=7, chunk_size=128, x_bins=200, max_period=max_period)
+    
+    serial = LogisticMap.generate_bifurcation_density(*args, n_workers=1, **kwargs)
+    parallel = LogisticMap.generate_bifurcation_density(*args, n_workers=2, **kwargs)
+    
+    for expected, result in zip(serial, parallel):
+        np.testing.assert_array_equal(result, expected)
+
+
+def test_bifurcation_seed_reproducible():
+    first = LogisticMap.generate_bifurcation_data(2.5, 4.0, 200, 20, 300, seed=3, chunk_size=64)
+    second = LogisticMap.generate_bifurcation_data(2.5, 4.0, 200, 20, 300, seed=3, chunk_size=64)
+    
+    np.testing.assert_array_equal(first[1], second[1])
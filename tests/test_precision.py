@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from src.simulation.precision import Quantized, quantize
+from src.systems.continuous import LorenzSystem
+from src.systems.discrete import LogisticMap
+from src.systems.fractals import ChaosGame
+
+# Cotas documentadas en src/simulation/precision.py, relativas al rango de cada eje
+FLOAT32_BOUND = 1e-6
+UINT16_BOUND = 0.5 / 65535 + 1e-7
+
+STATES = np.random.default_rng(0).normal(1.0, 0.01, size=(20, 3))
+CASES = {
+    "logistic.simulate": lambda d: LogisticMap(r=3.9).simulate(0.1, 2000, output_dtype=d),
+    "logistic.simulate_batch": lambda d: LogisticMap.simulate_batch(
+        np.linspace(0.1, 0.9, 50), 3.9, 200, output_dtype=d),
+    "logistic.bifurcation": lambda d: LogisticMap.generate_bifurcation_data(
+        2.5, 4.0, 500, 50, 300, seed=0, max_period=32, output_dtype=d)[1],
+    "lorenz.simulate": lambda d: LorenzSystem().simulate(1.0, 1.0, 1.0, 10, output_dtype=d),
+    "lorenz.simulate_ensemble": lambda d: LorenzSystem().simulate_ensemble(STATES, 2, output_dtype=d),
+    "chaos_game.generate_points": lambda d: ChaosGame().generate_points(20000, seed=0, output_dtype=d),
+}
+
+
+def _relative_error(result, reference):
+    """Error máximo por eje relativo al rango (cuantizado, en uint16) de ese eje."""
+    reference = np.asarray(reference, dtype=np.float64)
+    error = np.abs(np.asarray(result, dtype=np.float64) - reference)
+    axes = tuple(range(reference.ndim - 1)) if reference.ndim > 1 else None
+    if isinstance(result, Quantized):
+        span = result.scale * 65535
+    else:
+        span = np.ptp(reference, axis=axes)
+    return np.max(error.max(axis=axes) / np.maximum(span, np.finfo(float).tiny))
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_compact_outputs_within_documented_bounds(name):
+    reference = CASES[name]("float64")
+    as_float32 = CASES[name]("float32")
+    as_uint16 = CASES[name]("uint16")
+    
+    assert as_float32.dtype == np.float32 and as_float32.shape == reference.shape
+    assert isinstance(as_uint16, Quantized) and as_uint16.data.dtype == np.uint16
+    assert _relative_error(as_float32, reference) <= FLOAT32_BOUND
+    assert _relative_error(as_uint16, reference) <= UINT16_BOUND
+
+
+def test_quantized_column_slicing_uses_column_scale():
+    values = np.array([[0.0, 100.0, -5.0], [1.0, 300.0, 5.0], [0.5, 200.0, 0.0]])
+    q = quantize(values, values.min(axis=0), values.max(axis=0))
+    decoded = np.asarray(q)
+    
+    for index in [(slice(None), 0), (slice(None), 2), (1, 1), (slice(None), [2, 0]),
+                  (slice(0, 2), slice(1, None)), 1, slice(1, None)]:
+        np.testing.assert_array_equal(np.asarray(q[index]), decoded[index])
+
+
+def test_quantized_rejects_ambiguous_column_index():
+    q = quantize(np.ones((3, 3)), np.zeros(3), np.full(3, 2.0))
+    
+    for index in [(Ellipsis, 0), ([0, 1], [0, 1]), np.ones((3, 3), dtype=bool)]:
+        with pytest.raises(IndexError):
+            q[index]
+
+
+@pytest.mark.parametrize("initial_states", [(1.0, 1.0, 1.0), STATES[:2]])
+def test_simulate_to_store_output_dtype(tmp_path, initial_states):
+    system = LorenzSystem()
+    reference = np.array(system.simulate_to_store(str(tmp_path / "f64"), initial_states, 3.0).data)
+    
+    as_float32 = system.simulate_to_store(str(tmp_path / "f32"), initial_states, 3.0, output_dtype="float32")
+    # Sin value_range, el rango sale de una primera pasada: mínimo y máximo exactos por eje
+    as_uint16 = system.simulate_to_store(str(tmp_path / "u16"), initial_states, 3.0, output_dtype="uint16")
+    window = as_uint16.window(0.0, 3.0)
+    
+    assert as_float32.data.dtype == np.float32
+    assert _relative_error(as_float32.data, reference) <= FLOAT32_BOUND
+    assert as_uint16.data.dtype == np.uint16
+    np.testing.assert_array_equal(window.offset, reference.reshape(-1, 3).min(axis=0))
+    assert _relative_error(window, reference) <= UINT16_BOUND
+    with pytest.raises(ValueError):
+        system.simulate_to_store(str(tmp_path / "bad"), initial_states, 3.0, output_dtype="int8")
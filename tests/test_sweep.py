@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+import src.systems.continuous as continuous
+from src.systems.continuous import LorenzSystem
+
+SWEEP = dict(rho=[5.0, 15.0, 28.0], duration=2.0, transient=1.0, chunk_size=1)
+
+
+def _assert_same_sweep(result, expected):
+    assert result.keys() == expected.keys()
+    for key in expected:
+        np.testing.assert_array_equal(result[key], expected[key])
+
+
+def test_resumed_sweep_equals_uninterrupted(tmp_path, monkeypatch):
+    checkpoint = str(tmp_path / "sweep")
+    expected = LorenzSystem().sweep(**SWEEP)
+    
+    # Interrumpimos el barrido en la segunda tarea
+    calls = []
+    kernel = continuous._sweep_kernel
+    
+    def interrupted_kernel(outputs, *task):
+        calls.append(task[0])
+        if len(calls) == 2:
+            raise KeyboardInterrupt
+        kernel(outputs, *task)
+    
+    monkeypatch.setattr(continuous, "_sweep_kernel", interrupted_kernel)
+    with pytest.raises(KeyboardInterrupt):
+        LorenzSystem().sweep(checkpoint=checkpoint, **SWEEP)
+    monkeypatch.setattr(continuous, "_sweep_kernel", kernel)
+    
+    done = np.load(str(tmp_path / "sweep" / "done.npy"))
+    assert done.tolist() == [True, False, False]
+    
+    _assert_same_sweep(LorenzSystem().sweep(checkpoint=checkpoint, **SWEEP), expected)
+
+
+def test_mismatched_checkpoint_raises(tmp_path):
+    checkpoint = str(tmp_path / "sweep")
+    LorenzSystem().sweep(checkpoint=checkpoint, **SWEEP)
+    
+    with pytest.raises(ValueError):
+        LorenzSystem().sweep(checkpoint=checkpoint, **{**SWEEP, "rho": [5.0, 15.0, 30.0]})
+    with pytest.raises(ValueError):
+        LorenzSystem().sweep(checkpoint=checkpoint, **{**SWEEP, "duration": 3.0})
+
+
+def test_sweep_independent_of_workers():
+    _assert_same_sweep(LorenzSystem().sweep(n_workers=2, **SWEEP), LorenzSystem().sweep(**SWEEP))